@@ -3,148 +3,200 @@
 Script to convert string dates and integers to proper Python types in regtest files.
 """
 
+import functools
+import hashlib
+import json
+import os
 import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-
+# Single combined pattern covering every conversion: keyword and dict-key
+# forms of the date fields, followed by keyword and dict-key forms of the
+# integer fields.
+_PATTERN = re.compile(
+    rb'(?P<kw>start|stop|timestart)="(?P<date>\d{8}\s+\d{6})"'
+    rb'|"(?P<dkw>start|stop|timestart)":\s*"(?P<ddate>\d{8}\s+\d{6})"'
+    rb'|(?P<ikw>stride|timestride|timecount)="(?P<inum>\d+)"'
+    rb'|"(?P<dikw>stride|timestride|timecount)":\s*"(?P<dinum>\d+)"'
+)
+
+# Replacement for each alternative of _PATTERN, keyed by its value group (which
+# is always the match's lastgroup): (keyword group, output template, is date)
+_REPLACEMENTS = {
+    "date": ("kw", b"%s=%s", True),
+    "ddate": ("dkw", b'"%s": %s', True),
+    "inum": ("ikw", b"%s=%s", False),
+    "dinum": ("dikw", b'"%s": %s', False),
+}
+
+# Literal fragments at least one of which must be present for _PATTERN to
+# match ("start=" also covers "timestart=", "stride=" covers "timestride=").
+_LITERALS = (
+    b'start="',
+    b'stop="',
+    b'stride="',
+    b'timecount="',
+    b'"start"',
+    b'"stop"',
+    b'"timestart"',
+    b'"stride"',
+    b'"timestride"',
+    b'"timecount"',
+)
+
+# Digests of already-converted files, persisted between runs
+_CACHE_FILE = ".convert_cache.json"
+
+# Read size used when hashing files
+_CHUNK_SIZE = 1 << 16
+
+_DATETIME_IMPORT = b"from datetime import datetime"
+
+
+def _file_digest(filepath):
+    """Return a short digest of a file's content, read in fixed-size chunks."""
+    digest = hashlib.blake2b(digest_size=8)
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=2048)
 def convert_date_string(date_str):
-    """Convert WW3 date string YYYYMMDD HHMMSS to datetime(YYYY, M, D, H, M, S)."""
+    """Convert WW3 date bytes YYYYMMDD HHMMSS to datetime(YYYY, M, D, H, M, S)."""
     # Parse: "19680606 000000" -> datetime(1968, 6, 6, 0, 0, 0)
-    match = re.match(r"(\d{4})(\d{2})(\d{2})\s+(\d{2})(\d{2})(\d{2})", date_str)
-    if match:
-        y, m, d, hh, mm, ss = match.groups()
-        return (
-            f"datetime({int(y)}, {int(m)}, {int(d)}, {int(hh)}, {int(mm)}, {int(ss)})"
-        )
-    return None
-
-
-def process_file(filepath):
-    """Process a single file to convert string dates and integers."""
-    content = filepath.read_text()
-    original_content = content
+    # Fixed-width fields, so slice rather than running a second regex
+    date, time = date_str[:8], date_str[8:].lstrip()[:6]
+    if len(time) != 6 or not date.isdigit() or not time.isdigit():
+        return None
+    # The fields are known to be digits, so stripping leading zeros gives the
+    # same text as formatting int(field) without the int round trip
+    fields = (date[0:4], date[4:6], date[6:8], time[0:2], time[2:4], time[4:6])
+    return b"datetime(" + b", ".join(f.lstrip(b"0") or b"0" for f in fields) + b")"
+
+
+def process_file(filepath, cache=None):
+    """Process a single file to convert string dates and integers.
+
+    The file is streamed line by line into a temporary file next to it, which
+    replaces the original only if something was converted, so memory use is
+    bounded by the longest line rather than the file size.
+
+    If ``cache`` is given it maps file paths to content digests; files whose
+    digest is unchanged since the last run are skipped, and the digest of the
+    (possibly converted) content is recorded for the next run.
+    """
+    if cache is not None:
+        key = str(filepath)
+        digest = _file_digest(filepath)
+        if cache.get(key) == digest:
+            return False
 
     # Track if we need to add datetime import
     needs_datetime_import = False
-    has_datetime_import = (
-        "from datetime import datetime" in content or "import datetime" in content
-    )
-
-    # Pattern 1: start="YYYYMMDD HHMMSS"
-    def replace_start(match):
-        nonlocal needs_datetime_import
-        date_str = match.group(1)
-        datetime_obj = convert_date_string(date_str)
-        if datetime_obj:
-            needs_datetime_import = True
-            return f"start={datetime_obj}"
-        return match.group(0)
-
-    content = re.sub(r'start="(\d{8}\s+\d{6})"', replace_start, content)
-
-    # Pattern 2: stop="YYYYMMDD HHMMSS"
-    def replace_stop(match):
-        nonlocal needs_datetime_import
-        date_str = match.group(1)
-        datetime_obj = convert_date_string(date_str)
-        if datetime_obj:
-            needs_datetime_import = True
-            return f"stop={datetime_obj}"
-        return match.group(0)
-
-    content = re.sub(r'stop="(\d{8}\s+\d{6})"', replace_stop, content)
-
-    # Pattern 3: timestart="YYYYMMDD HHMMSS"
-    def replace_timestart(match):
-        nonlocal needs_datetime_import
-        date_str = match.group(1)
-        datetime_obj = convert_date_string(date_str)
-        if datetime_obj:
-            needs_datetime_import = True
-            return f"timestart={datetime_obj}"
-        return match.group(0)
-
-    content = re.sub(r'timestart="(\d{8}\s+\d{6})"', replace_timestart, content)
-
-    # Pattern 4: stride="NNNNN"
-    content = re.sub(r'stride="(\d+)"', r"stride=\1", content)
-
-    # Pattern 5: timestride="NNNNN"
-    content = re.sub(r'timestride="(\d+)"', r"timestride=\1", content)
-
-    # Pattern 6: timecount="NNNNN"
-    content = re.sub(r'timecount="(\d+)"', r"timecount=\1", content)
+    has_datetime_import = False
+    last_import = None
 
-    # Pattern 7: Dict syntax - "start": "YYYYMMDD HHMMSS"
-    def replace_dict_start(match):
+    def replace(match):
         nonlocal needs_datetime_import
-        date_str = match.group(1)
-        datetime_obj = convert_date_string(date_str)
-        if datetime_obj:
+        value_group = match.lastgroup
+        keyword_group, template, is_date = _REPLACEMENTS[value_group]
+        keyword, value = match.group(keyword_group, value_group)
+        if is_date:
+            value = convert_date_string(value)
+            if value is None:
+                return match.group(0)
             needs_datetime_import = True
-            return f'"start": {datetime_obj}'
-        return match.group(0)
-
-    content = re.sub(r'"start":\s*"(\d{8}\s+\d{6})"', replace_dict_start, content)
-
-    # Pattern 8: Dict syntax - "stop": "YYYYMMDD HHMMSS"
-    def replace_dict_stop(match):
-        nonlocal needs_datetime_import
-        date_str = match.group(1)
-        datetime_obj = convert_date_string(date_str)
-        if datetime_obj:
-            needs_datetime_import = True
-            return f'"stop": {datetime_obj}'
-        return match.group(0)
-
-    content = re.sub(r'"stop":\s*"(\d{8}\s+\d{6})"', replace_dict_stop, content)
-
-    # Pattern 9: Dict syntax - "timestart": "YYYYMMDD HHMMSS"
-    def replace_dict_timestart(match):
-        nonlocal needs_datetime_import
-        date_str = match.group(1)
-        datetime_obj = convert_date_string(date_str)
-        if datetime_obj:
-            needs_datetime_import = True
-            return f'"timestart": {datetime_obj}'
-        return match.group(0)
-
-    content = re.sub(
-        r'"timestart":\s*"(\d{8}\s+\d{6})"', replace_dict_timestart, content
-    )
-
-    # Pattern 10: Dict syntax - "stride": "NNNNN"
-    content = re.sub(r'"stride":\s*"(\d+)"', r'"stride": \1', content)
-
-    # Pattern 11: Dict syntax - "timestride": "NNNNN"
-    content = re.sub(r'"timestride":\s*"(\d+)"', r'"timestride": \1', content)
-
-    # Pattern 12: Dict syntax - "timecount": "NNNNN"
-    content = re.sub(r'"timecount":\s*"(\d+)"', r'"timecount": \1', content)
-
-    # Add datetime import if needed and not present
-    if needs_datetime_import and not has_datetime_import:
-        # Find the first import line and add after it
-        lines = content.split("\n")
-        insert_index = 0
-        for i, line in enumerate(lines):
-            if line.startswith("from ") or line.startswith("import "):
-                insert_index = i + 1
-            elif insert_index > 0 and not line.startswith(
-                ("from ", "import ", "#", "\n", "")
-            ):
-                break
-
-        if insert_index > 0:
-            lines.insert(insert_index, "from datetime import datetime")
-            content = "\n".join(lines)
-
-    # Write back if changed
-    if content != original_content:
-        filepath.write_text(content)
-        return True
-    return False
+        return template % (keyword, value)
+
+    dirname = os.path.dirname(filepath) or "."
+    tmp = tempfile.NamedTemporaryFile("wb", dir=dirname, delete=False)
+    try:
+        modified = 0
+        with open(filepath, "rb") as src, tmp:
+            for lineno, line in enumerate(src):
+                if line.startswith((b"from ", b"import ")):
+                    last_import = lineno
+                if _DATETIME_IMPORT in line or b"import datetime" in line:
+                    has_datetime_import = True
+                if any(literal in line for literal in _LITERALS):
+                    # Every match is rewritten, so a non-zero count means the
+                    # file changed
+                    line, count = _PATTERN.subn(replace, line)
+                    modified += count
+                tmp.write(line)
+
+        if not modified:
+            if cache is not None:
+                cache[key] = digest
+            return False
+
+        # Add datetime import after the last import line if needed and not
+        # present; this needs a second streaming pass over the converted lines
+        if needs_datetime_import and not has_datetime_import:
+            if last_import is not None:
+                _insert_line_after(tmp.name, last_import, _DATETIME_IMPORT)
+
+        shutil.copymode(filepath, tmp.name)
+        os.replace(tmp.name, filepath)
+    finally:
+        if os.path.exists(tmp.name):
+            os.unlink(tmp.name)
+
+    if cache is not None:
+        cache[key] = _file_digest(filepath)
+    return True
+
+
+def _insert_line_after(filepath, lineno, text):
+    """Insert ``text`` as a new line after line ``lineno`` (0-based) of a file."""
+    dirname = os.path.dirname(filepath) or "."
+    dst = tempfile.NamedTemporaryFile("wb", dir=dirname, delete=False)
+    try:
+        with open(filepath, "rb") as src, dst:
+            for i, line in enumerate(src):
+                if i == lineno:
+                    if line.endswith(b"\n"):
+                        line += text + b"\n"
+                    else:
+                        line += b"\n" + text
+                dst.write(line)
+        os.replace(dst.name, filepath)
+    finally:
+        if os.path.exists(dst.name):
+            os.unlink(dst.name)
+
+
+def _iter_py_files(root):
+    """Recursively yield paths of Python files below ``root``.
+
+    The regression test runner itself is skipped.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_py_files(entry.path)
+            elif entry.name.endswith(".py") and entry.name != "run_regression_tests.py":
+                yield entry.path
+
+
+def _process_worker(filepath, digest):
+    """Run process_file in a worker process with a single-entry cache.
+
+    Returns ``(filepath, modified, digest, error)`` so the parent can update
+    the shared cache and report results.
+    """
+    cache = {str(filepath): digest} if digest is not None else {}
+    try:
+        modified = process_file(filepath, cache)
+    except Exception as e:
+        return filepath, False, digest, e
+    return filepath, modified, cache.get(str(filepath)), None
 
 
 def main():
@@ -157,21 +209,30 @@ def main():
         print(f"Error: Directory {regtests_dir} does not exist")
         sys.exit(1)
 
-    py_files = list(regtests_dir.glob("**/*.py"))
-    py_files = [
-        f for f in py_files if "run_regression_tests.py" not in f.name
-    ]  # Skip test runner
+    py_files = list(_iter_py_files(str(regtests_dir)))
 
     print(f"Found {len(py_files)} Python files in regtests directory")
 
+    cache_path = regtests_dir / _CACHE_FILE
+    cache = json.loads(cache_path.read_text()) if cache_path.exists() else {}
+
+    # Files are independent, so convert them in parallel
+    digests = [cache.get(f) for f in py_files]
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_process_worker, py_files, digests, chunksize=16))
+
     modified_count = 0
-    for filepath in py_files:
-        try:
-            if process_file(filepath):
-                modified_count += 1
-                print(f"  Modified: {filepath.relative_to(regtests_dir)}")
-        except Exception as e:
-            print(f"  Error processing {filepath}: {e}")
+    for filepath, modified, digest, error in results:
+        if error is not None:
+            print(f"  Error processing {filepath}: {error}")
+            continue
+        if digest is not None:
+            cache[str(filepath)] = digest
+        if modified:
+            modified_count += 1
+            print(f"  Modified: {os.path.relpath(filepath, regtests_dir)}")
+
+    cache_path.write_text(json.dumps(cache, indent=2, sort_keys=True))
 
     print(f"\nProcessed {len(py_files)} files, modified {modified_count} files")
 
@@ -8,14 +8,17 @@ This example demonstrates:
 - Configuring coupling between grids
 """
 
+import os
 from datetime import datetime
 from pathlib import Path
 
 from rompy_ww3.config import Config
 from rompy_ww3.grid import Grid
 from rompy_ww3.namelists import (
+    AllType,
     Domain,
     InputGrid,
+    IType,
     ModelGrid,
     OutputType,
     OutputDate,
@@ -29,6 +32,11 @@ from rompy_ww3.namelists.output_date import (
     OutputDatePoint,
     OutputDateRestart,
 )
+from rompy_ww3.namelists.output_type import (
+    OutputTypeField,
+    OutputTypePoint,
+    OutputTypeTrack,
+)
 
 
 def main():
@@ -68,15 +76,17 @@ def main():
         f"   Input grid: {input_grid.name}, winds forcing = {input_grid.forcing.winds}"
     )
 
-    # Model grid configurations (e.g., regional models)
+    # Model grid configurations (e.g., regional models), both forced by the
+    # global input grid winds
+    model_grid_forcing = ModelGridForcing(
+        winds="global",
+        currents="no",
+        water_levels="no",
+        ice_conc="no",
+    )
     model_grid1 = ModelGrid(
         name="region1",
-        forcing=ModelGridForcing(
-            winds="global",
-            currents="no",
-            water_levels="no",
-            ice_conc="no",
-        ),
+        forcing=model_grid_forcing,
         resource=ModelGridResource(
             rank_id=0,
             group_id=0,
@@ -88,12 +98,7 @@ def main():
 
     model_grid2 = ModelGrid(
         name="region2",
-        forcing=ModelGridForcing(
-            winds="global",
-            currents="no",
-            water_levels="no",
-            ice_conc="no",
-        ),
+        forcing=model_grid_forcing,
         resource=ModelGridResource(
             rank_id=1,
             group_id=0,
@@ -135,18 +140,15 @@ def main():
         f"   Grid 2: {grid2.grid_type} ({grid2.nx}x{grid2.ny}) from {grid2.x0},{grid2.y0} with dx={grid2.dx:.3f}, dy={grid2.dy:.3f}"
     )
 
-    # Output configuration
+    # Output configuration, built from typed submodels so nested dicts do not
+    # need to be validated into models; the field list is shared by all types
+    output_field = OutputTypeField(list="HSIGN TMM10 TM02 PDIR PENT")
     output_type = OutputType(
-        field={"list": "HSIGN TMM10 TM02 PDIR PENT"},
-        point={"file": "points.inp", "active": True},
-        track={"format": 1},
-        alltype={
-            "field": {"list": "HSIGN TMM10 TM02 PDIR PENT"},
-        },
-        itype=[
-            {"field": {"list": "HSIGN TMM10 TM02 PDIR PENT"}},
-            {"field": {"list": "HSIGN TMM10 TM02 PDIR PENT"}},
-        ],
+        field=output_field,
+        point=OutputTypePoint(file="points.inp"),
+        track=OutputTypeTrack(format=True),
+        alltype=AllType(field=output_field),
+        itype=[IType(field=output_field), IType(field=output_field)],
     )
     print(f"   Output: Field variables = {output_type.field.list}")
 
@@ -218,10 +220,10 @@ def main():
     print(f"   Namelist files generated in: {result['namelists_dir']}")
 
     # List the generated files
-    namelists_path = Path(result["namelists_dir"])
-    for file_path in namelists_path.iterdir():
-        if file_path.is_file():
-            print(f"   - {file_path.name}")
+    with os.scandir(result["namelists_dir"]) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.is_file(follow_symlinks=False):
+                print(f"   - {entry.name}")
 
     # 4. Show a summary
     print("\n4. Multi-Grid Configuration Summary")
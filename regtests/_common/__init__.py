@@ -0,0 +1,25 @@
+"""Shared helpers for the rompy-ww3 regression test scripts.
+
+The per-test scripts add the ``regtests`` directory to ``sys.path`` and import
+from this package, so configuration code common to several tests lives in one
+place instead of being repeated in every script.
+"""
+
+from .fixtures import BASIC_OUTPUT, EXTENDED_OUTPUT, NO_FORCING, WIND_FORCING
+from .mww3_builder import (
+    ModelGridSpec,
+    build_mww3,
+    generate_mww3,
+    time_range_from_domain,
+)
+
+__all__ = [
+    "BASIC_OUTPUT",
+    "EXTENDED_OUTPUT",
+    "NO_FORCING",
+    "WIND_FORCING",
+    "ModelGridSpec",
+    "build_mww3",
+    "generate_mww3",
+    "time_range_from_domain",
+]
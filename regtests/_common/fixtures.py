@@ -0,0 +1,18 @@
+"""Settings shared verbatim by several mww3 tests.
+
+Plain values only: tests that use the same forcing flags or field output
+list import them from here and pass them to :mod:`.mww3_builder`, which
+builds fresh namelist objects for every test.
+"""
+
+# No external forcing on any grid (propagation only)
+NO_FORCING = dict(water_levels="no", currents="no", winds="no", ice_conc="no")
+
+# Wind forcing from files, no other external forcing
+WIND_FORCING = dict(water_levels="no", currents="no", winds="T", ice_conc="no")
+
+# Basic integrated wave parameters
+BASIC_OUTPUT = "HS FP DP DIR"
+
+# Basic parameters plus spread, wind and current fields
+EXTENDED_OUTPUT = "HS FP DP DIR SPR WND CUR"
@@ -0,0 +1,162 @@
+"""Builder for the mww3_test_* multi-grid regression test configurations.
+
+The mww3 tests only differ in their grid layout, forcing flags, output fields
+and time bounds, so each test script describes those as data and calls
+:func:`build_mww3` to construct the Multi component.
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from rompy.core.time import TimeRange
+    from rompy.model import ModelRun
+    from rompy_ww3.components import Multi
+    from rompy_ww3.namelists import Domain
+    from rompy_ww3.namelists.input import InputGrid
+
+
+class ModelGridSpec(NamedTuple):
+    """Specification of one model grid in an mww3 test.
+
+    Attributes:
+        name: Model grid name
+        forcing: Keyword arguments for ModelGridForcing
+        rank_id: MPI rank assignment
+        comm_frac_start: Start of the communicator fraction for this grid
+        comm_frac_end: End of the communicator fraction for this grid
+        group_id: MPI group assignment
+    """
+
+    name: str
+    forcing: Dict[str, str]
+    rank_id: int
+    comm_frac_start: float
+    comm_frac_end: float
+    group_id: int = 1
+
+
+def build_mww3(
+    start: datetime,
+    stop: datetime,
+    grids: List[ModelGridSpec],
+    output_list: str,
+    stride: int,
+    input_grid: Optional["InputGrid"] = None,
+) -> "Multi":
+    """Create the Multi component for an mww3 regression test.
+
+    Args:
+        start: Run start time
+        stop: Run stop time
+        grids: Model grid specifications, in rank order
+        output_list: Space-separated field output list
+        stride: Field output stride in seconds
+        input_grid: Optional input grid providing forcing to the model grids
+
+    Returns:
+        Multi component with domain, model grids and output configuration
+    """
+    # Importing rompy_ww3 builds the schemas of the whole namelist model tree,
+    # so it is deferred until a test actually builds its configuration
+    from rompy_ww3.components import Multi
+    from rompy_ww3.namelists import Domain
+    from rompy_ww3.namelists.input import (
+        ModelGrid,
+        ModelGridForcing,
+        ModelGridResource,
+    )
+    from rompy_ww3.namelists.output_date import OutputDate, OutputDateField
+    from rompy_ww3.namelists.output_type import AllType, OutputTypeField
+
+    domain = Domain(
+        start=start,
+        stop=stop,
+        iostyp=1,  # Unified point output
+        nrinp=1,  # Number of input grids (minimum 1 required)
+        nrgrd=len(grids),
+    )
+
+    model_grids = [
+        ModelGrid(
+            name=grid.name,
+            forcing=ModelGridForcing(**grid.forcing),
+            resource=ModelGridResource(
+                rank_id=grid.rank_id,
+                group_id=grid.group_id,
+                comm_frac_start=grid.comm_frac_start,
+                comm_frac_end=grid.comm_frac_end,
+            ),
+        )
+        for grid in grids
+    ]
+
+    output_type = AllType(
+        field=OutputTypeField(list=output_list),
+    )
+
+    output_date = OutputDate(
+        field=OutputDateField(
+            start=start,
+            stride=stride,
+            stop=stop,
+        ),
+    )
+
+    components = {}
+    if input_grid is not None:
+        components["input_grid"] = input_grid
+
+    return Multi(
+        domain=domain,
+        model_grids=model_grids,
+        output_type=output_type,
+        output_date=output_date,
+        **components,
+    )
+
+
+def time_range_from_domain(domain: "Domain", interval: str) -> "TimeRange":
+    """Create the model run period spanning a Domain's start and stop times.
+
+    Args:
+        domain: Domain whose start and stop bound the run
+        interval: Time step of the period (e.g., '1h', '30m')
+
+    Returns:
+        TimeRange from the domain start to the domain stop
+    """
+    from rompy.core.time import TimeRange
+
+    return TimeRange(start=domain.start, end=domain.stop, interval=interval)
+
+
+def generate_mww3(
+    test_id: str, multi_component: "Multi", period: "TimeRange"
+) -> "ModelRun":
+    """Generate the namelists for an mww3 regression test.
+
+    Args:
+        test_id: Test identifier (e.g., 'mww3_test_01')
+        multi_component: Multi component returned by :func:`build_mww3`
+        period: Model run period
+
+    Returns:
+        The ModelRun used to generate the namelists
+    """
+    # Only needed when generating, so importing the builder stays cheap
+    from rompy.model import ModelRun
+    from rompy_ww3.config import ShelConfig
+
+    # ShelConfig's model_type default does not match its discriminator tag,
+    # so it is passed explicitly for ModelRun to accept the config
+    config = ShelConfig(model_type="shel", multi_component=multi_component)
+
+    model_run = ModelRun(
+        run_id=f"ww3_{test_id}_regression",
+        config=config,
+        period=period,
+        output_dir="rompy_runs",
+    )
+    model_run.generate()
+    return model_run
@@ -7,127 +7,84 @@ Purpose: Validate multi-grid coupling and boundary exchange.
 Reference: https://github.com/NOAA-EMC/WW3/tree/develop/regtests/mww3_test_01
 """
 
-from rompy.model import ModelRun
-from rompy.core.time import TimeRange
-
-from rompy_ww3.config import NMLConfig
-
-from rompy_ww3.components import Multi
-
-from rompy_ww3.namelists import (
-    Domain,
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Shared regression test helpers live in regtests/_common
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _common import (  # noqa: E402
+    BASIC_OUTPUT,
+    WIND_FORCING,
+    ModelGridSpec,
+    build_mww3,
+    generate_mww3,
+    time_range_from_domain,
 )
-from rompy_ww3.namelists.input import (
-    ModelGrid,
-    ModelGridForcing,
-    ModelGridResource,
+
+logger = logging.getLogger(__name__)
+
+# Logged once namelist generation has finished
+SUMMARY = "\n".join(
+    (
+        "",
+        "=" * 80,
+        "EXAMPLE COMPLETED SUCCESSFULLY!",
+        "=" * 80,
+        "",
+        "Generated namelists for mww3_test_01 test:",
+        "  - ww3_multi.nml: Multi-grid configuration",
+        "  - Configuration includes:",
+        "    * 2 model grids (coarse and fine)",
+        "    * Grid coupling and boundary exchange",
+        "    * Per-grid resource allocation",
+        "    * Per-grid timesteps and spectrum",
+        "",
+        "This test validates basic multi-grid WW3 functionality.",
+    )
 )
-from rompy_ww3.namelists.output_date import OutputDate, OutputDateField
-from rompy_ww3.namelists.output_type import OutputType, OutputTypeField
 
 
 def create_ww3_mww3_test_01_component():
     """Create rompy-ww3 Multi component for mww3_test_01 multi-grid test."""
-
-    # Domain configuration for multi-grid run
-    domain = Domain(
-        start="20200101 000000",
-        stop="20200102 000000",
-        iostyp=1,  # Unified point output
-        nrinp=1,  # Number of input grids (minimum 1 required)
-        nrgrd=2,  # Number of model grids
+    return build_mww3(
+        start=datetime(2020, 1, 1),
+        stop=datetime(2020, 1, 2),
+        # (name, forcing, rank_id, comm_frac_start, comm_frac_end)
+        grids=[
+            # Coarse grid (outer domain)
+            ModelGridSpec("coarse", WIND_FORCING, 1, 0.00, 0.50),
+            # Fine grid (nested domain) on a different MPI rank
+            ModelGridSpec("fine", WIND_FORCING, 2, 0.50, 1.00),
+        ],
+        output_list=BASIC_OUTPUT,
+        stride=3600,
     )
 
-    # Model grid 1 - Coarse grid (outer domain)
-    model_grid1 = ModelGrid(
-        name="coarse",
-        forcing=ModelGridForcing(
-            water_levels="no",
-            currents="no",
-            winds="T",  # Wind forcing from files
-            ice_conc="no",
-        ),
-        resource=ModelGridResource(
-            rank_id=1,  # MPI rank assignment
-            group_id=1,
-            comm_frac_start=0.00,
-            comm_frac_end=0.50,
-        ),
-    )
-
-    # Model grid 2 - Fine grid (nested domain)
-    model_grid2 = ModelGrid(
-        name="fine",
-        forcing=ModelGridForcing(
-            water_levels="no",
-            currents="no",
-            winds="T",  # Wind forcing from files
-            ice_conc="no",
-        ),
-        resource=ModelGridResource(
-            rank_id=2,  # Different MPI rank
-            group_id=1,
-            comm_frac_start=0.50,
-            comm_frac_end=1.00,
-        ),
-    )
-
-    # Output configuration
-    output_type = OutputType(
-        field=OutputTypeField(list="HS FP DP DIR"),
-    )
-
-    output_date = OutputDate(
-        field=OutputDateField(
-            start="20200101 000000",
-            stride=3600,
-            stop="20200102 000000",
-        ),
-    )
-
-    # Create Multi component with all configurations
-    multi_component = Multi(
-        domain=domain,
-        model_grids=[model_grid1, model_grid2],
-        output_type=output_type,
-        output_date=output_date,
-    )
-
-    return multi_component
-
 
 def main():
     """Generate WW3 multi-grid configuration for mww3_test_01 regression test."""
-    print("Creating WW3 multi-grid configuration for mww3_test_01 regression test...")
-    print("Test: Basic multi-grid with 2 coupled grids")
+    logger.info(
+        "Creating WW3 multi-grid configuration for mww3_test_01 regression test..."
+    )
+    logger.info("Test: Basic multi-grid with 2 coupled grids")
 
     multi_component = create_ww3_mww3_test_01_component()
 
-    # Create configuration with Multi component
-    config = NMLConfig(multi_component=multi_component)
+    period = time_range_from_domain(multi_component.domain, "1h")
 
-    period = TimeRange(start="2020-01-01T00:00:00", duration="1D", interval="1H")
+    generate_mww3("mww3_test_01", multi_component, period)
 
-    model_run = ModelRun(
-        run_id="ww3_mww3_test_01_regression",
-        config=config,
-        period=period,
-        output_dir="rompy_runs",
-    )
-    model_run.generate()
-
-    print("\n" + "=" * 80)
-    print("EXAMPLE COMPLETED SUCCESSFULLY!")
-    print("=" * 80)
-    print("\nGenerated namelists for mww3_test_01 test:")
-    print("  - ww3_multi.nml: Multi-grid configuration")
-    print("  - Configuration includes:")
-    print("    * 2 model grids (coarse and fine)")
-    print("    * Grid coupling and boundary exchange")
-    print("    * Per-grid resource allocation")
-    print("    * Per-grid timesteps and spectrum")
-    print("\nThis test validates basic multi-grid WW3 functionality.")
+    logger.info(SUMMARY)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    sys.exit(main())
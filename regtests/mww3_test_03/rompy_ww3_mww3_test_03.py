@@ -8,144 +8,92 @@ Purpose: Validate advanced multi-grid capabilities including differential forcin
 Reference: https://github.com/NOAA-EMC/WW3/tree/develop/regtests/mww3_test_03
 """
 
-from rompy.model import ModelRun
-from rompy.core.time import TimeRange
-
-from rompy_ww3.config import NMLConfig
-
-from rompy_ww3.components import Multi
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Shared regression test helpers live in regtests/_common
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _common import (  # noqa: E402
+    ModelGridSpec,
+    build_mww3,
+    generate_mww3,
+    time_range_from_domain,
+)
 
-from rompy_ww3.namelists import Domain
-from rompy_ww3.namelists.input import (
-    ModelGrid,
-    ModelGridForcing,
-    ModelGridResource,
+logger = logging.getLogger(__name__)
+
+# Currents and winds on every grid; water levels on the fine grid only
+FORCING = dict(water_levels="no", currents="T", winds="T", ice_conc="no")
+FINE_FORCING = dict(water_levels="T", currents="T", winds="T", ice_conc="no")
+
+# Logged once namelist generation has finished
+SUMMARY = "\n".join(
+    (
+        "",
+        "=" * 80,
+        "EXAMPLE COMPLETED SUCCESSFULLY!",
+        "=" * 80,
+        "",
+        "Generated namelists for mww3_test_03 test:",
+        "  - ww3_multi.nml: Advanced multi-grid configuration",
+        "  - Configuration includes:",
+        "    * 3 model grids with differential forcing",
+        "    * Comprehensive output field list (20+ variables)",
+        "    * High-frequency output (every 15 minutes)",
+        "    * Water levels enabled on fine grid only",
+        "    * Currents enabled on all three grids",
+        "    * Non-uniform resource allocation (30%/35%/35%)",
+        "    * Extended simulation duration (1.5 days)",
+        "",
+        "This test demonstrates advanced WW3 multi-grid capabilities:",
+        "  - Differential forcing per grid (water levels on fine only)",
+        "  - Non-uniform resource distribution for load balancing",
+        "  - Extended output: wave partitions, mean periods, peak parameters",
+        "  - High-frequency output for detailed temporal evolution",
+    )
 )
-from rompy_ww3.namelists.output_date import OutputDate, OutputDateField
-from rompy_ww3.namelists.output_type import OutputType, OutputTypeField
 
 
 def create_ww3_mww3_test_03_component():
     """Create rompy-ww3 Multi component for mww3_test_03 advanced multi-grid test."""
-
-    domain = Domain(
-        start="20200101 000000",
-        stop="20200102 120000",
-        iostyp=1,
-        nrinp=1,
-        nrgrd=3,
+    return build_mww3(
+        start=datetime(2020, 1, 1),
+        stop=datetime(2020, 1, 2, 12),
+        # (name, forcing, rank_id, comm_frac_start, comm_frac_end)
+        grids=[
+            ModelGridSpec("coarse", FORCING, 1, 0.00, 0.30),
+            ModelGridSpec("medium", FORCING, 2, 0.30, 0.65),
+            ModelGridSpec("fine", FINE_FORCING, 3, 0.65, 1.00),
+        ],
+        output_list="HS FP DP DIR SPR WND CUR WCC WCF WCH WCM T02 T01 T0M1 FP0 THP0 THS EF TH1M TH2M",
+        stride=900,
     )
 
-    model_grid1 = ModelGrid(
-        name="coarse",
-        forcing=ModelGridForcing(
-            water_levels="no",
-            currents="T",
-            winds="T",
-            ice_conc="no",
-        ),
-        resource=ModelGridResource(
-            rank_id=1,
-            group_id=1,
-            comm_frac_start=0.00,
-            comm_frac_end=0.30,
-        ),
-    )
-
-    model_grid2 = ModelGrid(
-        name="medium",
-        forcing=ModelGridForcing(
-            water_levels="no",
-            currents="T",
-            winds="T",
-            ice_conc="no",
-        ),
-        resource=ModelGridResource(
-            rank_id=2,
-            group_id=1,
-            comm_frac_start=0.30,
-            comm_frac_end=0.65,
-        ),
-    )
-
-    model_grid3 = ModelGrid(
-        name="fine",
-        forcing=ModelGridForcing(
-            water_levels="T",
-            currents="T",
-            winds="T",
-            ice_conc="no",
-        ),
-        resource=ModelGridResource(
-            rank_id=3,
-            group_id=1,
-            comm_frac_start=0.65,
-            comm_frac_end=1.00,
-        ),
-    )
-
-    output_type = OutputType(
-        field=OutputTypeField(
-            list="HS FP DP DIR SPR WND CUR WCC WCF WCH WCM T02 T01 T0M1 FP0 THP0 THS EF TH1M TH2M"
-        ),
-    )
-
-    output_date = OutputDate(
-        field=OutputDateField(
-            start="20200101 000000",
-            stride=900,
-            stop="20200102 120000",
-        ),
-    )
-
-    multi_component = Multi(
-        domain=domain,
-        model_grids=[model_grid1, model_grid2, model_grid3],
-        output_type=output_type,
-        output_date=output_date,
-    )
-
-    return multi_component
-
 
 def main():
     """Generate WW3 multi-grid configuration for mww3_test_03 regression test."""
-    print("Creating WW3 multi-grid configuration for mww3_test_03 regression test...")
-    print("Test: Advanced multi-grid with 3 grids and extended features")
+    logger.info(
+        "Creating WW3 multi-grid configuration for mww3_test_03 regression test..."
+    )
+    logger.info("Test: Advanced multi-grid with 3 grids and extended features")
 
     multi_component = create_ww3_mww3_test_03_component()
 
-    config = NMLConfig(multi_component=multi_component)
+    period = time_range_from_domain(multi_component.domain, "15m")
 
-    period = TimeRange(start="2020-01-01T00:00:00", duration="36H", interval="15m")
+    generate_mww3("mww3_test_03", multi_component, period)
 
-    model_run = ModelRun(
-        run_id="ww3_mww3_test_03_regression",
-        config=config,
-        period=period,
-        output_dir="rompy_runs",
-    )
-    model_run.generate()
-
-    print("\n" + "=" * 80)
-    print("EXAMPLE COMPLETED SUCCESSFULLY!")
-    print("=" * 80)
-    print("\nGenerated namelists for mww3_test_03 test:")
-    print("  - ww3_multi.nml: Advanced multi-grid configuration")
-    print("  - Configuration includes:")
-    print("    * 3 model grids with differential forcing")
-    print("    * Comprehensive output field list (20+ variables)")
-    print("    * High-frequency output (every 15 minutes)")
-    print("    * Water levels enabled on fine grid only")
-    print("    * Currents enabled on all three grids")
-    print("    * Non-uniform resource allocation (30%/35%/35%)")
-    print("    * Extended simulation duration (1.5 days)")
-    print("\nThis test demonstrates advanced WW3 multi-grid capabilities:")
-    print("  - Differential forcing per grid (water levels on fine only)")
-    print("  - Non-uniform resource distribution for load balancing")
-    print("  - Extended output: wave partitions, mean periods, peak parameters")
-    print("  - High-frequency output for detailed temporal evolution")
+    logger.info(SUMMARY)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    sys.exit(main())
@@ -7,133 +7,84 @@ Purpose: Validate propagation with boundary conditions and inner grid with
 Reference: https://github.com/NOAA-EMC/WW3/tree/develop/regtests/mww3_test_04
 """
 
-from rompy.model import ModelRun
-from rompy.core.time import TimeRange
-from rompy_ww3.config import NMLConfig
-from rompy_ww3.components import Multi
-from rompy_ww3.namelists import Domain
-from rompy_ww3.namelists.input import ModelGrid, ModelGridForcing, ModelGridResource
-from rompy_ww3.namelists.output_date import OutputDate, OutputDateField
-from rompy_ww3.namelists.output_type import OutputType, OutputTypeField
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Shared regression test helpers live in regtests/_common
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _common import (  # noqa: E402
+    BASIC_OUTPUT,
+    NO_FORCING,
+    ModelGridSpec,
+    build_mww3,
+    generate_mww3,
+    time_range_from_domain,
+)
+
+logger = logging.getLogger(__name__)
+
+# Logged once namelist generation has finished
+SUMMARY = "\n".join(
+    (
+        "",
+        "=" * 80,
+        "EXAMPLE COMPLETED SUCCESSFULLY!",
+        "=" * 80,
+        "",
+        "Generated namelists for mww3_test_04 test:",
+        "  - ww3_multi.nml: Multi-grid configuration",
+        "  - Configuration includes:",
+        "    * 3 model grids (bound, outer, inner)",
+        "    * Boundary grid with 1-D propagation",
+        "    * Inner grid with shallow water support",
+        "    * No source terms (propagation only)",
+    )
+)
 
 
 def create_ww3_mww3_test_04_component():
     """Create rompy-ww3 Multi component for mww3_test_04 multi-grid test."""
-
-    domain = Domain(
-        start="20200101 000000",
-        stop="20200101 120000",
-        iostyp=1,
-        nrinp=1,
-        nrgrd=3,
-    )
-
-    # Boundary grid - 1-D propagation with preset boundary data
-    model_grid_bound = ModelGrid(
-        name="bound",
-        forcing=ModelGridForcing(
-            water_levels="no",
-            currents="no",
-            winds="no",
-            ice_conc="no",
-        ),
-        resource=ModelGridResource(
-            rank_id=1,
-            group_id=1,
-            comm_frac_start=0.00,
-            comm_frac_end=0.25,
-        ),
-    )
-
-    # Outer grid - full 2-D propagation with constant depth
-    model_grid_outer = ModelGrid(
-        name="outer",
-        forcing=ModelGridForcing(
-            water_levels="no",
-            currents="no",
-            winds="no",
-            ice_conc="no",
-        ),
-        resource=ModelGridResource(
-            rank_id=2,
-            group_id=1,
-            comm_frac_start=0.25,
-            comm_frac_end=0.60,
-        ),
+    return build_mww3(
+        start=datetime(2020, 1, 1),
+        stop=datetime(2020, 1, 1, 12),
+        # (name, forcing, rank_id, comm_frac_start, comm_frac_end)
+        grids=[
+            # Boundary grid - 1-D propagation with preset boundary data
+            ModelGridSpec("bound", NO_FORCING, 1, 0.00, 0.25),
+            # Outer grid - full 2-D propagation with constant depth
+            ModelGridSpec("outer", NO_FORCING, 2, 0.25, 0.60),
+            # Inner grid - higher resolution with shallow water
+            ModelGridSpec("inner", NO_FORCING, 3, 0.60, 1.00),
+        ],
+        output_list=BASIC_OUTPUT,
+        stride=3600,
     )
 
-    # Inner grid - higher resolution with shallow water
-    model_grid_inner = ModelGrid(
-        name="inner",
-        forcing=ModelGridForcing(
-            water_levels="no",
-            currents="no",
-            winds="no",
-            ice_conc="no",
-        ),
-        resource=ModelGridResource(
-            rank_id=3,
-            group_id=1,
-            comm_frac_start=0.60,
-            comm_frac_end=1.00,
-        ),
-    )
-
-    output_type = OutputType(
-        field=OutputTypeField(list="HS FP DP DIR"),
-    )
-
-    output_date = OutputDate(
-        field=OutputDateField(
-            start="20200101 000000",
-            stride=3600,
-            stop="20200101 120000",
-        ),
-    )
-
-    multi_component = Multi(
-        domain=domain,
-        model_grids=[model_grid_bound, model_grid_outer, model_grid_inner],
-        output_type=output_type,
-        output_date=output_date,
-    )
-
-    return multi_component
-
 
 def main():
     """Generate WW3 multi-grid configuration for mww3_test_04 regression test."""
-    print("Creating WW3 multi-grid configuration for mww3_test_04 regression test...")
-    print("Test: Static nesting with lateral boundary data from file")
+    logger.info(
+        "Creating WW3 multi-grid configuration for mww3_test_04 regression test..."
+    )
+    logger.info("Test: Static nesting with lateral boundary data from file")
 
     multi_component = create_ww3_mww3_test_04_component()
-    config = NMLConfig(multi_component=multi_component)
 
-    period = TimeRange(
-        start="2020-01-01T00:00:00",
-        end="2020-01-01T12:00:00",
-        interval="1h",
-    )
+    period = time_range_from_domain(multi_component.domain, "1h")
 
-    model_run = ModelRun(
-        run_id="ww3_mww3_test_04_regression",
-        config=config,
-        period=period,
-        output_dir="rompy_runs",
-    )
-    model_run.generate()
+    generate_mww3("mww3_test_04", multi_component, period)
 
-    print("\n" + "=" * 80)
-    print("EXAMPLE COMPLETED SUCCESSFULLY!")
-    print("=" * 80)
-    print("\nGenerated namelists for mww3_test_04 test:")
-    print("  - ww3_multi.nml: Multi-grid configuration")
-    print("  - Configuration includes:")
-    print("    * 3 model grids (bound, outer, inner)")
-    print("    * Boundary grid with 1-D propagation")
-    print("    * Inner grid with shallow water support")
-    print("    * No source terms (propagation only)")
+    logger.info(SUMMARY)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    sys.exit(main())
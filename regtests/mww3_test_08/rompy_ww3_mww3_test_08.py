@@ -6,130 +6,83 @@ Purpose: Validate multi-grid with atmospheric and ice forcing
 Reference: https://github.com/NOAA-EMC/WW3/tree/develop/regtests/mww3_test_08
 """
 
-from rompy.model import ModelRun
-from rompy.core.time import TimeRange
-from rompy_ww3.config import NMLConfig
-from rompy_ww3.components import Multi
-from rompy_ww3.namelists import Domain
-from rompy_ww3.namelists.input import (
-    ModelGrid,
-    ModelGridForcing,
-    ModelGridResource,
-    InputGrid,
-    InputForcing,
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Shared regression test helpers live in regtests/_common
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _common import (  # noqa: E402
+    ModelGridSpec,
+    build_mww3,
+    generate_mww3,
+    time_range_from_domain,
 )
-from rompy_ww3.namelists.output_date import OutputDate, OutputDateField
-from rompy_ww3.namelists.output_type import OutputType, OutputTypeField
 
-
-def create_ww3_mww3_test_08_component():
-    """Create rompy-ww3 Multi component for mww3_test_08 multi-grid test."""
-
-    domain = Domain(
-        start="20200101 000000",
-        stop="20200102 000000",
-        iostyp=1,
-        nrinp=1,
-        nrgrd=2,
-    )
-
-    input_grid = InputGrid(
-        name="input",
-        forcing=InputForcing(
-            water_levels="F",
-            currents="F",
-            winds="T",
-            ice_conc="T",
-        ),
-    )
-
-    model_grid1 = ModelGrid(
-        name="grd_a",
-        forcing=ModelGridForcing(
-            water_levels="F",
-            currents="F",
-            winds="T",
-            ice_conc="T",
-        ),
-        resource=ModelGridResource(
-            rank_id=1,
-            group_id=1,
-            comm_frac_start=0.00,
-            comm_frac_end=0.50,
-        ),
-    )
-
-    model_grid2 = ModelGrid(
-        name="grd_b",
-        forcing=ModelGridForcing(
-            water_levels="F",
-            currents="F",
-            winds="T",
-            ice_conc="T",
-        ),
-        resource=ModelGridResource(
-            rank_id=2,
-            group_id=1,
-            comm_frac_start=0.50,
-            comm_frac_end=1.00,
-        ),
-    )
-
-    output_type = OutputType(
-        field=OutputTypeField(list="HS FP DP DIR ICE WND"),
+logger = logging.getLogger(__name__)
+
+# Wind and ice forcing, shared by the input grid and both model grids
+FORCING = dict(water_levels="F", currents="F", winds="T", ice_conc="T")
+
+# Logged once namelist generation has finished
+SUMMARY = "\n".join(
+    (
+        "",
+        "=" * 80,
+        "EXAMPLE COMPLETED SUCCESSFULLY!",
+        "=" * 80,
+        "",
+        "Generated namelists for mww3_test_08 test:",
+        "  - ww3_multi.nml: Multi-grid configuration",
+        "  - Configuration includes:",
+        "    * 2 model grids with input grid",
+        "    * Wind and ice forcing",
+        "    * Multi-grid forcing propagation",
     )
+)
 
-    output_date = OutputDate(
-        field=OutputDateField(
-            start="20200101 000000",
-            stride=3600,
-            stop="20200102 000000",
-        ),
-    )
 
-    multi_component = Multi(
-        domain=domain,
-        input_grid=input_grid,
-        model_grids=[model_grid1, model_grid2],
-        output_type=output_type,
-        output_date=output_date,
+def create_ww3_mww3_test_08_component():
+    """Create rompy-ww3 Multi component for mww3_test_08 multi-grid test."""
+    from rompy_ww3.namelists.input import InputForcing, InputGrid
+
+    return build_mww3(
+        start=datetime(2020, 1, 1),
+        stop=datetime(2020, 1, 2),
+        # (name, forcing, rank_id, comm_frac_start, comm_frac_end)
+        grids=[
+            ModelGridSpec("grd_a", FORCING, 1, 0.00, 0.50),
+            ModelGridSpec("grd_b", FORCING, 2, 0.50, 1.00),
+        ],
+        output_list="HS FP DP DIR ICE WND",
+        stride=3600,
+        input_grid=InputGrid(name="input", forcing=InputForcing(**FORCING)),
     )
 
-    return multi_component
-
 
 def main():
     """Generate WW3 multi-grid configuration for mww3_test_08 regression test."""
-    print("Creating WW3 multi-grid configuration for mww3_test_08 regression test...")
-    print("Test: ww3_multi with wind and ice input")
+    logger.info(
+        "Creating WW3 multi-grid configuration for mww3_test_08 regression test..."
+    )
+    logger.info("Test: ww3_multi with wind and ice input")
 
     multi_component = create_ww3_mww3_test_08_component()
-    config = NMLConfig(multi_component=multi_component)
 
-    period = TimeRange(
-        start="2020-01-01T00:00:00",
-        end="2020-01-02T00:00:00",
-        interval="1H",
-    )
+    period = time_range_from_domain(multi_component.domain, "1h")
 
-    model_run = ModelRun(
-        run_id="ww3_mww3_test_08_regression",
-        config=config,
-        period=period,
-        output_dir="rompy_runs",
-    )
-    model_run.generate()
+    generate_mww3("mww3_test_08", multi_component, period)
 
-    print("\n" + "=" * 80)
-    print("EXAMPLE COMPLETED SUCCESSFULLY!")
-    print("=" * 80)
-    print("\nGenerated namelists for mww3_test_08 test:")
-    print("  - ww3_multi.nml: Multi-grid configuration")
-    print("  - Configuration includes:")
-    print("    * 2 model grids with input grid")
-    print("    * Wind and ice forcing")
-    print("    * Multi-grid forcing propagation")
+    logger.info(SUMMARY)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Generate the namelists for all mww3 multi-grid regression tests.
+
+Each mww3_test_NN script builds its configuration and writes its namelists
+independently, so the scripts are run concurrently in worker processes.
+"""
+
+import argparse
+import importlib.util
+import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Optional
+
+REGTESTS_DIR = Path(__file__).resolve().parent
+
+logger = logging.getLogger(__name__)
+
+
+def discover_tests(names: Optional[List[str]] = None) -> List[Path]:
+    """Find the mww3 test scripts.
+
+    Args:
+        names: Test names to select (e.g., 'mww3_test_04'), or None for all
+
+    Returns:
+        Sorted list of test script paths
+    """
+    scripts = sorted(REGTESTS_DIR.glob("mww3_test_[0-9]*/rompy_ww3_mww3_test_*.py"))
+    if names:
+        scripts = [script for script in scripts if script.parent.name in names]
+    return scripts
+
+
+def _configure_logging() -> None:
+    """Set up logging; also run in each spawned worker, which starts unconfigured."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
+def _run_test(script: Path) -> str:
+    """Load a test script and run its main() in the current process.
+
+    Args:
+        script: Path to the test script
+
+    Returns:
+        Name of the test that was generated
+    """
+    spec = importlib.util.spec_from_file_location(script.stem, script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.main()
+    return script.parent.name
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Generate namelists for the mww3 regression tests in parallel"
+    )
+    parser.add_argument(
+        "tests",
+        nargs="*",
+        help="Tests to generate (e.g., mww3_test_04); default is all",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes (default: one per test, up to CPU count)",
+    )
+    args = parser.parse_args()
+
+    _configure_logging()
+
+    scripts = discover_tests(args.tests)
+    if not scripts:
+        logger.error("No mww3 tests found")
+        return 1
+
+    workers = args.workers or min(len(scripts), os.cpu_count() or 1)
+    logger.info(f"Generating {len(scripts)} mww3 tests with {workers} workers")
+
+    # spawn avoids forking a parent that may already hold numpy/xarray state
+    context = multiprocessing.get_context("spawn")
+    failed = []
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_configure_logging
+    ) as executor:
+        futures = {
+            executor.submit(_run_test, script): script.parent.name for script in scripts
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"{name} failed: {e}")
+                failed.append(name)
+            else:
+                logger.info(f"{name} generated")
+
+    if failed:
+        logger.error(f"{len(failed)} of {len(scripts)} tests failed: {sorted(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
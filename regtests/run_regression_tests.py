@@ -13,9 +13,9 @@ from pathlib import Path
 # Add regtests to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from runner import TestRunner
+from runner import ResultCache, TestRunner
 from runner.backends import LocalBackend, DockerBackend
-from runner.core.result import TestStatus
+from runner.core.result import TestResult, TestStatus
 
 
 def setup_logging(verbose: bool = False):
@@ -32,6 +32,18 @@ def setup_logging(verbose: bool = False):
     )
 
 
+def print_result(result: TestResult):
+    """Print a one-line status for a finished test.
+
+    Args:
+        result: Result of the finished test
+    """
+    status_symbol = "✓" if result.status == TestStatus.SUCCESS else "✗"
+    print(f"  {status_symbol} {result.test_name}: {result.status.value}", flush=True)
+    if result.error_message:
+        print(f"    Error: {result.error_message}", flush=True)
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -127,6 +139,25 @@ Examples:
         help="WW3 GitHub release tag to use for reference namelists (default: 6.07.1 or WW3_REFERENCE_TAG env)",
     )
 
+    # Parallel execution
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of tests to run concurrently (default: 1)",
+    )
+
+    # Result reuse
+    parser.add_argument(
+        "--reuse-results",
+        action="store_true",
+        help="Skip tests whose config, inputs and backend version match an earlier "
+        "successful run (results cached in OUTPUT_DIR/.cache); has no effect "
+        "with --validate-namelists",
+    )
+
     # Output streaming
     parser.add_argument(
         "--stream",
@@ -172,7 +203,15 @@ Examples:
 
         os.environ["WW3_REFERENCE_TAG"] = args.ww3_reference_tag
 
-    runner = TestRunner(backend=backend, output_dir=args.output_dir)
+    result_cache = None
+    if args.reuse_results and args.validate_namelists:
+        logger.warning("--reuse-results has no effect with --validate-namelists")
+    elif args.reuse_results:
+        result_cache = ResultCache(args.output_dir / ".cache")
+
+    runner = TestRunner(
+        backend=backend, output_dir=args.output_dir, result_cache=result_cache
+    )
 
     # Discover tests based on selection
     if args.all:
@@ -234,11 +273,14 @@ Examples:
 
         return 0 if result.status == TestStatus.SUCCESS else 1
     else:
-        # Run multiple tests
+        # Run multiple tests, printing each result as soon as it finishes
+        print("\nIndividual Results:")
         suite_result = runner.run_all(
             tests,
             validate_namelists=args.validate_namelists,
             skip_model_execution=args.skip_model_execution,
+            jobs=args.jobs,
+            on_result=print_result,
         )
 
         # Print summary
@@ -247,13 +289,6 @@ Examples:
         print("=" * 70)
         print(suite_result.summary())
         print("=" * 70)
-        print("\nIndividual Results:")
-        for result in suite_result.results:
-            status_symbol = "✓" if result.status == TestStatus.SUCCESS else "✗"
-            print(f"  {status_symbol} {result.test_name}: {result.status.value}")
-            if result.error_message:
-                print(f"    Error: {result.error_message}")
-        print("=" * 70)
 
         return 0 if suite_result.is_success() else 1
 
@@ -30,6 +30,7 @@ Usage:
 from .core.runner import TestRunner
 from .core.test import TestCase
 from .core.result import TestResult, TestSuiteResult, TestStatus
+from .core.result_cache import ResultCache
 from .core.validator import Validator, ComparisonMode
 from .core.namelist_comparator import (
     NamelistComparator,
@@ -45,6 +46,7 @@ __all__ = [
     "TestResult",
     "TestSuiteResult",
     "TestStatus",
+    "ResultCache",
     "Backend",
     "Validator",
     "ComparisonMode",
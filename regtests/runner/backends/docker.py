@@ -1,6 +1,7 @@
+import threading
 import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 import logging
 
 from .base import Backend
@@ -14,6 +15,10 @@ class DockerBackend(Backend):
     def __init__(self, image: str = "rompy/ww3:latest", docker_client=None):
         self.image = image
         self.docker_client = docker_client
+        # Daemon probes are cached so repeated calls do not re-ping Docker
+        self._env_valid: Optional[bool] = None
+        self._version_info: Optional[Dict[str, str]] = None
+        self._probe_lock = threading.Lock()
 
     def execute(self, test: TestCase, workdir: Path) -> TestResult:
         logger.info(f"Executing {test.name} via Docker backend")
@@ -28,25 +33,32 @@ class DockerBackend(Backend):
         )
 
     def validate_env(self) -> bool:
-        try:
-            import docker
+        with self._probe_lock:
+            if self._env_valid is None:
+                try:
+                    import docker
 
-            client = docker.from_env()
-            client.ping()
-            return True
-        except Exception:
-            return False
+                    client = docker.from_env()
+                    client.ping()
+                    self._env_valid = True
+                except Exception:
+                    self._env_valid = False
+            return self._env_valid
 
     def get_version_info(self) -> Dict[str, str]:
-        info = {}
+        with self._probe_lock:
+            if self._version_info is None:
+                info = {}
 
-        try:
-            import docker
+                try:
+                    import docker
 
-            client = docker.from_env()
-            info["docker"] = client.version()["Version"]
-            info["image"] = self.image
-        except Exception:
-            pass
+                    client = docker.from_env()
+                    info["docker"] = client.version()["Version"]
+                    info["image"] = self.image
+                except Exception:
+                    pass
 
-        return info
+                self._version_info = info
+
+            return dict(self._version_info)
@@ -1,8 +1,9 @@
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import logging
 
 from .base import Backend
@@ -11,6 +12,9 @@ from ..core.result import TestResult, TestStatus
 
 logger = logging.getLogger(__name__)
 
+# Maximum bytes read from the model's stdout per read when streaming
+STREAM_CHUNK_SIZE = 1 << 16
+
 
 class LocalBackend(Backend):
     def __init__(
@@ -25,7 +29,13 @@ class LocalBackend(Backend):
             backend_config
             or Path(__file__).parent.parent.parent / "backends" / "local_backend.yml"
         )
+        self._backend_config_abs = str(self.backend_config.absolute())
         self.stream_output = stream_output
+        # `rompy --version` output, probed once per backend; the lock keeps
+        # concurrent callers from seeing the probe before it has finished
+        self._rompy_version: Optional[str] = None
+        self._rompy_probed = False
+        self._rompy_probe_lock = threading.Lock()
 
     def execute(self, test: TestCase, workdir: Path) -> TestResult:
         logger.info(f"Executing {test.name} via local backend")
@@ -58,18 +68,22 @@ class LocalBackend(Backend):
                 error_message=str(e),
             )
 
+    def _run_command(self, test: TestCase) -> List[str]:
+        """Build the `rompy run` command line for a test."""
+        return [
+            "rompy",
+            "run",
+            test.config_path_abs,
+            "--backend-config",
+            self._backend_config_abs,
+        ]
+
     def _execute_buffered(
         self, test: TestCase, regtests_dir: Path, start_time: float
     ) -> TestResult:
         """Execute with buffered output (default behavior)."""
         result = subprocess.run(
-            [
-                "rompy",
-                "run",
-                str(test.config_path.absolute()),
-                "--backend-config",
-                str(self.backend_config.absolute()),
-            ],
+            self._run_command(test),
             cwd=regtests_dir,
             capture_output=True,
             text=True,
@@ -98,40 +112,50 @@ class LocalBackend(Backend):
     ) -> TestResult:
         """Execute with streaming output (real-time)."""
         process = subprocess.Popen(
-            [
-                "rompy",
-                "run",
-                str(test.config_path.absolute()),
-                "--backend-config",
-                str(self.backend_config.absolute()),
-            ],
+            self._run_command(test),
             cwd=regtests_dir,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,  # Line buffered
         )
 
+        # Drain stderr in the background so a child writing a lot to stderr
+        # cannot block on a full pipe while stdout is being streamed
+        stderr_chunks = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()),
+            daemon=True,
+        )
+        stderr_reader.start()
+
         logs = []
 
-        # Stream stdout in real-time
-        if process.stdout:
-            for line in process.stdout:
-                line = line.rstrip()
-                logs.append(line)
-                print(line, flush=True)  # Stream to console
+        # Stream stdout in real-time, reading whatever is available in large
+        # chunks rather than one line at a time
+        pending = b""
+        while True:
+            chunk = process.stdout.read1(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b"\n")
+            if lines:
+                lines = [line.decode(errors="replace").rstrip() for line in lines]
+                logs.extend(lines)
+                print("\n".join(lines), flush=True)  # Stream to console
+        if pending:
+            line = pending.decode(errors="replace").rstrip()
+            logs.append(line)
+            print(line, flush=True)
 
         # Wait for process to complete
         process.wait()
         execution_time = time.time() - start_time
 
-        # Capture any remaining stderr
-        stderr_output = ""
-        if process.stderr:
-            stderr_output = process.stderr.read()
-            if stderr_output:
-                print(stderr_output, file=sys.stderr, flush=True)
-                logs.append(stderr_output)
+        # Report stderr once the process has finished
+        stderr_reader.join()
+        stderr_output = b"".join(stderr_chunks).decode(errors="replace")
+        if stderr_output:
+            print(stderr_output, file=sys.stderr, flush=True)
+            logs.append(stderr_output)
 
         if process.returncode == 0:
             status = TestStatus.SUCCESS
@@ -148,7 +172,21 @@ class LocalBackend(Backend):
             error_message=error_message,
         )
 
-    def validate_env(self) -> bool:
+    def _probe_rompy_version(self) -> Optional[str]:
+        """Return the rompy version, or None if rompy is unusable.
+
+        The probe runs once per backend; validate_env and get_version_info
+        share its result.
+        """
+        with self._rompy_probe_lock:
+            if not self._rompy_probed:
+                self._rompy_version = self._run_rompy_version()
+                self._rompy_probed = True
+        return self._rompy_version
+
+    @staticmethod
+    def _run_rompy_version() -> Optional[str]:
+        """Run `rompy --version` and return its output, or None on failure."""
         try:
             result = subprocess.run(
                 ["rompy", "--version"],
@@ -156,23 +194,20 @@ class LocalBackend(Backend):
                 text=True,
                 timeout=10,
             )
-            return result.returncode == 0
+            if result.returncode == 0:
+                return result.stdout.strip()
         except Exception:
-            return False
+            pass
+        return None
+
+    def validate_env(self) -> bool:
+        return self._probe_rompy_version() is not None
 
     def get_version_info(self) -> Dict[str, str]:
         info = {}
 
-        try:
-            result = subprocess.run(
-                ["rompy", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                info["rompy"] = result.stdout.strip()
-        except Exception:
-            pass
+        version = self._probe_rompy_version()
+        if version is not None:
+            info["rompy"] = version
 
         return info
@@ -5,6 +5,7 @@ This module contains the core classes for test execution:
 - TestRunner: Main orchestrator
 - TestCase: Test encapsulation
 - TestResult: Result representation
+- ResultCache: Reuse of results for unchanged tests
 - Validator: Output validation logic
 - ReportGenerator: Test result reporting
 """
@@ -12,6 +13,7 @@ This module contains the core classes for test execution:
 from .runner import TestRunner
 from .test import TestCase, ValidationResult
 from .result import TestResult, TestSuiteResult, TestStatus
+from .result_cache import ResultCache
 from .validator import Validator
 from .report import ReportGenerator
 from .namelist_comparator import (
@@ -27,6 +29,7 @@ __all__ = [
     "TestResult",
     "TestSuiteResult",
     "TestStatus",
+    "ResultCache",
     "Validator",
     "ValidationResult",
     "ReportGenerator",
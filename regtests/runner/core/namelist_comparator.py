@@ -4,14 +4,28 @@ This module provides functionality to compare generated WW3 namelist files
 against reference namelists from the NOAA WW3 repository.
 """
 
+import fnmatch
+import io
 import logging
+import os
 import re
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
-from urllib.request import urlopen
+from typing import Iterator, List, Optional, Dict, Tuple
+from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 from difflib import unified_diff
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
 logger = logging.getLogger(__name__)
 
 # Default WW3 release tag to use for reference lookups
@@ -22,6 +36,24 @@ NOAA_WW3_RAW_URL = (
     f"https://raw.githubusercontent.com/NOAA-EMC/WW3/{DEFAULT_WW3_TAG}/regtests"
 )
 
+# Maximum number of reference namelists downloaded concurrently
+MAX_DOWNLOAD_WORKERS = 16
+
+# Size of the chunks in which downloads are written to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of unified diff lines kept for a mismatched namelist
+MAX_DIFF_LINES = 500
+
+# Test name suffix selecting a grid set (e.g., 'mww3_test_02_grdset_a')
+_GRDSET_RE = re.compile(r"(.+)_(grdset_[a-z0-9]+)$")
+
+# Runs of whitespace collapsed when normalizing namelist lines
+_WS_RE = re.compile(r"\s+")
+
+# Comment from '!' to the end of its line
+_COMMENT_RE = re.compile(r"!.*")
+
 # Default namelist file patterns to compare
 DEFAULT_NAMELIST_PATTERNS = [
     "ww3_shel.nml",
@@ -36,6 +68,7 @@ DEFAULT_NAMELIST_PATTERNS = [
 ]
 
 
+@lru_cache(maxsize=512)
 def _parse_grdset(test_name: str) -> Tuple[str, Optional[str]]:
     """Parse test name to extract base name and grdset.
 
@@ -46,12 +79,116 @@ def _parse_grdset(test_name: str) -> Tuple[str, Optional[str]]:
         Tuple of (base_test_name, grdset_name or None)
         Example: ('mww3_test_02', 'grdset_a') or ('tp1.1', None)
     """
-    grdset_match = re.match(r"(.+)_(grdset_[a-z0-9]+)$", test_name)
+    grdset_match = _GRDSET_RE.match(test_name)
     if grdset_match:
         return grdset_match.group(1), grdset_match.group(2)
     return test_name, None
 
 
+@lru_cache(maxsize=512)
+def _repo_test_name(test_name: str) -> Tuple[str, Optional[str]]:
+    """Map a test name to its directory name in the NOAA repository.
+
+    Args:
+        test_name: Name of the test (e.g., 'tp1.1' or 'mww3_test_02_grdset_a')
+
+    Returns:
+        Tuple of (repository test name, grdset name or None)
+        Example: ('ww3_tp1.1', None) or ('mww3_test_02', 'grdset_a')
+    """
+    base_name, grdset = _parse_grdset(test_name)
+    # The NOAA repo uses names like 'mww3_test_01' or 'ww3_tp1.1'.
+    # Avoid adding an extra 'ww3_' prefix when the base_name already
+    # contains the expected prefix (e.g., 'mww3_test_01' or 'ww3_...').
+    if base_name.startswith("mww3") or base_name.startswith("ww3_"):
+        return base_name, grdset
+    return f"ww3_{base_name}", grdset
+
+
+def _create_session() -> "requests.Session":
+    """Create an HTTP session with a connection pool for reference downloads.
+
+    The pool holds one connection per download worker, and transient server
+    errors are retried with backoff.
+    """
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_maxsize=MAX_DOWNLOAD_WORKERS, max_retries=retries)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _normalize_line(
+    line: str, normalize_whitespace: bool, ignore_comments: bool
+) -> str:
+    """Normalize a namelist line for comparison.
+
+    Args:
+        line: Raw line from namelist
+        normalize_whitespace: Whether to strip and collapse whitespace
+        ignore_comments: Whether to drop everything after '!'
+
+    Returns:
+        Normalized line
+    """
+    # Remove comments if configured
+    if ignore_comments:
+        # Remove everything after !
+        if "!" in line:
+            line = line[: line.index("!")]
+
+    # Normalize whitespace
+    if normalize_whitespace:
+        # Strip leading/trailing whitespace
+        line = line.strip()
+        # Normalize internal whitespace
+        line = _WS_RE.sub(" ", line)
+
+    return line
+
+
+@lru_cache(maxsize=256)
+def _normalize_namelist(
+    data: bytes, normalize_whitespace: bool, ignore_comments: bool
+) -> Tuple[str, ...]:
+    """Decode namelist file contents and split them into normalized lines.
+
+    Gives the same lines as applying :func:`_normalize_line` to each line.
+    With whitespace normalization, comments are removed from the whole text
+    in one pass and each line is collapsed with str.split, which is several
+    times faster than a per-line regex substitution.
+
+    Results are memoized by content: a reference namelist shared by several
+    tests, or compared again in a later run, is normalized only once.
+
+    Args:
+        data: Raw file contents
+        normalize_whitespace: Whether to strip and collapse whitespace
+        ignore_comments: Whether to drop everything after '!'
+
+    Returns:
+        Normalized lines, without empty lines when normalizing whitespace
+    """
+    # Decode as open(path, "r") would: default encoding and universal newlines
+    text = io.TextIOWrapper(io.BytesIO(data)).read()
+
+    if not normalize_whitespace:
+        lines = text.split("\n")
+        lines = [line + "\n" for line in lines[:-1]] + [lines[-1]]
+        return tuple(
+            _normalize_line(line, normalize_whitespace, ignore_comments)
+            for line in lines
+            if line
+        )
+
+    if ignore_comments:
+        text = _COMMENT_RE.sub("", text)
+    normalized = (" ".join(line.split()) for line in text.split("\n"))
+    # Skip empty lines after normalization
+    return tuple(line for line in normalized if line)
+
+
 class NamelistDiff:
     """Represents a difference between two namelist files.
 
@@ -192,6 +329,8 @@ class NamelistComparator:
         self.namelist_patterns = namelist_patterns or DEFAULT_NAMELIST_PATTERNS
         self.normalize_whitespace = normalize_whitespace
         self.ignore_comments = ignore_comments
+        # Keep-alive connection pool shared by all downloads (requires requests)
+        self._session = _create_session() if requests is not None else None
 
     def get_reference_namelist_path(self, test_name: str, namelist_file: str) -> Path:
         """Get local path for caching a reference namelist.
@@ -203,15 +342,7 @@ class NamelistComparator:
         Returns:
             Path to local reference namelist file
         """
-        base_name, grdset = _parse_grdset(test_name)
-        # The NOAA repo uses names like 'mww3_test_01' or 'ww3_tp1.1'.
-        # Avoid adding an extra 'ww3_' prefix when the base_name already
-        # contains the expected prefix (e.g., 'mww3_test_01' or 'ww3_...').
-        if base_name.startswith("mww3") or base_name.startswith("ww3_"):
-            repo_test_name = base_name
-        else:
-            repo_test_name = f"ww3_{base_name}"
-
+        repo_test_name, grdset = _repo_test_name(test_name)
         if grdset:
             return (
                 self.reference_dir / repo_test_name / "input" / grdset / namelist_file
@@ -228,13 +359,7 @@ class NamelistComparator:
         Returns:
             URL to download the reference namelist
         """
-        base_name, grdset = _parse_grdset(test_name)
-        # See note in get_reference_namelist_path: don't double-prefix names
-        if base_name.startswith("mww3") or base_name.startswith("ww3_"):
-            repo_test_name = base_name
-        else:
-            repo_test_name = f"ww3_{base_name}"
-
+        repo_test_name, grdset = _repo_test_name(test_name)
         if grdset:
             return f"{self.base_url}/{repo_test_name}/input/{grdset}/{namelist_file}"
         return f"{self.base_url}/{repo_test_name}/{namelist_file}"
@@ -247,17 +372,26 @@ class NamelistComparator:
         Args:
             test_name: Name of the test
             namelist_file: Name of the namelist file
-            force: If True, re-download even if file exists
+            force: If True, re-download even if file exists. A cached file
+                whose ETag was recorded is revalidated instead, and kept if
+                the server reports it unchanged.
 
         Returns:
             Path to downloaded file, or None if download failed
         """
         local_path = self.get_reference_namelist_path(test_name, namelist_file)
+        etag_path = local_path.with_name(local_path.name + ".etag")
 
         # Check if already cached
-        if local_path.exists() and not force:
-            logger.debug(f"Using cached reference: {local_path}")
-            return local_path
+        etag = None
+        if local_path.exists():
+            if not force:
+                logger.debug(f"Using cached reference: {local_path}")
+                return local_path
+            try:
+                etag = etag_path.read_text().strip() or None
+            except OSError:
+                pass
 
         # Download from NOAA
         url = self.get_reference_url(test_name, namelist_file)
@@ -268,15 +402,20 @@ class NamelistComparator:
             local_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Download file
-            with urlopen(url, timeout=60) as response:
-                content = response.read()
-                if content:
-                    local_path.write_bytes(content)
-                    logger.debug(f"Downloaded {namelist_file} to {local_path}")
-                    return local_path
+            size, new_etag = self._fetch(url, local_path, etag=etag)
+            if size is None:
+                logger.debug(f"Cached reference is up to date: {local_path}")
+                return local_path
+            if size:
+                if new_etag:
+                    etag_path.write_text(new_etag)
                 else:
-                    logger.warning(f"Empty content from {url}")
-                    return None
+                    etag_path.unlink(missing_ok=True)
+                logger.debug(f"Downloaded {namelist_file} to {local_path}")
+                return local_path
+            else:
+                logger.warning(f"Empty content from {url}")
+                return None
 
         except HTTPError as e:
             if e.code == 404:
@@ -291,6 +430,93 @@ class NamelistComparator:
             logger.error(f"Error downloading {url}: {e}")
             return None
 
+    def _fetch(
+        self, url: str, local_path: Path, etag: Optional[str] = None
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """Download a URL to a local file.
+
+        Uses the pooled requests session when available so successive
+        downloads reuse connections, and urlopen otherwise. The body is
+        streamed to a temporary file next to local_path, which replaces
+        local_path only if it is not empty.
+
+        Args:
+            url: URL to fetch
+            local_path: Destination file
+            etag: ETag of a cached copy; the server skips the body if the
+                resource still has this ETag
+
+        Returns:
+            Tuple of (number of bytes written, or None if not modified since
+            etag, ETag of the response)
+
+        Raises:
+            HTTPError: If the server returns an error status
+            URLError: If the server cannot be reached
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+
+        if self._session is None:
+            try:
+                with urlopen(Request(url, headers=headers), timeout=60) as response:
+                    size = self._write_stream(
+                        local_path,
+                        iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b""),
+                    )
+                    return size, response.headers.get("ETag")
+            except HTTPError as e:
+                if e.code == 304:
+                    return None, etag
+                raise
+
+        try:
+            with self._session.get(
+                url, headers=headers, timeout=60, stream=True
+            ) as response:
+                if response.status_code == 304:
+                    return None, etag
+                if response.status_code >= 400:
+                    raise HTTPError(
+                        url,
+                        response.status_code,
+                        response.reason,
+                        response.headers,
+                        None,
+                    )
+                size = self._write_stream(
+                    local_path, response.iter_content(DOWNLOAD_CHUNK_SIZE)
+                )
+                return size, response.headers.get("ETag")
+        except requests.RequestException as e:
+            raise URLError(e) from e
+
+    @staticmethod
+    def _write_stream(local_path: Path, chunks: Iterator[bytes]) -> int:
+        """Write downloaded chunks to local_path via a temporary file.
+
+        Args:
+            local_path: Destination file
+            chunks: Chunks of the response body
+
+        Returns:
+            Number of bytes written; local_path is left untouched if zero
+        """
+        fd, tmp_name = tempfile.mkstemp(
+            dir=local_path.parent, prefix=f".{local_path.name}.", suffix=".tmp"
+        )
+        try:
+            size = 0
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+            if size:
+                os.replace(tmp_name, local_path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+        return size
+
     def download_all_references(
         self, test_name: str, force: bool = False
     ) -> Dict[str, Optional[Path]]:
@@ -303,78 +529,93 @@ class NamelistComparator:
         Returns:
             Dictionary mapping namelist names to paths (or None if failed)
         """
-        results = {}
-        for pattern in self.namelist_patterns:
-            # Handle glob patterns
-            if "*" in pattern or "?" in pattern:
-                # For glob patterns, we need to check what files exist
-                # For now, just try the pattern as-is
-                path = self.download_reference_namelist(test_name, pattern, force)
-                results[pattern] = path
-            else:
-                path = self.download_reference_namelist(test_name, pattern, force)
-                results[pattern] = path
+        if not self.namelist_patterns:
+            return {}
+
+        with self._download_executor() as executor:
+            downloads = self._submit_reference_downloads(executor, test_name, force)
+            return {pattern: future.result() for pattern, future in downloads.items()}
+
+    def _download_executor(self) -> ThreadPoolExecutor:
+        """Create a thread pool sized for downloading one test's references."""
+        return ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_DOWNLOAD_WORKERS, len(self.namelist_patterns)))
+        )
 
-        return results
+    def _submit_reference_downloads(
+        self, executor: ThreadPoolExecutor, test_name: str, force: bool = False
+    ) -> Dict[str, "Future[Optional[Path]]"]:
+        """Start downloading all reference namelists for a test.
 
-    def _normalize_line(self, line: str) -> str:
-        """Normalize a line for comparison.
+        Each download is one network round trip, so they run concurrently.
+        Glob patterns are tried as-is, like specific file names.
 
         Args:
-            line: Raw line from namelist
+            executor: Thread pool to run the downloads in
+            test_name: Name of the test
+            force: If True, re-download even if files exist
 
         Returns:
-            Normalized line
+            Dictionary mapping namelist names to download futures
         """
-        # Remove comments if configured
-        if self.ignore_comments:
-            # Remove everything after !
-            if "!" in line:
-                line = line[: line.index("!")]
+        return {
+            pattern: executor.submit(
+                self.download_reference_namelist, test_name, pattern, force
+            )
+            for pattern in self.namelist_patterns
+        }
 
-        # Normalize whitespace
-        if self.normalize_whitespace:
-            # Strip leading/trailing whitespace
-            line = line.strip()
-            # Normalize internal whitespace
-            line = re.sub(r"\s+", " ", line)
+    def _read_namelist_bytes(self, file_path: Path) -> Optional[bytes]:
+        """Read the raw contents of a namelist file.
 
-        return line
+        Args:
+            file_path: Path to namelist file
+
+        Returns:
+            File contents, or None if the file could not be read
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        try:
+            return file_path.read_bytes()
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to read {file_path}: {e}")
+            return None
 
-    def _read_namelist_lines(self, file_path: Path) -> List[str]:
-        """Read and normalize namelist file.
+    def _decode_namelist_lines(
+        self, data: Optional[bytes], file_path: Path
+    ) -> List[str]:
+        """Decode and normalize namelist contents read by _read_namelist_bytes.
 
         Args:
-            file_path: Path to namelist file
+            data: Raw file contents, or None if reading failed
+            file_path: Path the contents were read from, for error messages
 
         Returns:
             List of normalized lines
         """
-        if not file_path.exists():
+        if data is None:
             return []
 
         try:
-            with open(file_path, "r") as f:
-                lines = f.readlines()
+            lines = _normalize_namelist(
+                data, self.normalize_whitespace, self.ignore_comments
+            )
         except Exception as e:
             logger.error(f"Failed to read {file_path}: {e}")
             return []
 
-        # Normalize each line
-        normalized = []
-        for line in lines:
-            norm_line = self._normalize_line(line)
-            # Skip empty lines after normalization
-            if norm_line or not self.normalize_whitespace:
-                normalized.append(norm_line)
-
-        return normalized
+        return list(lines)
 
     def compare_namelists(
         self,
         generated_path: Path,
         reference_path: Path,
         namelist_name: str,
+        include_diff: bool = True,
     ) -> NamelistDiff:
         """Compare two namelist files and generate diff.
 
@@ -382,12 +623,16 @@ class NamelistComparator:
             generated_path: Path to generated namelist
             reference_path: Path to reference namelist
             namelist_name: Name of the namelist for reporting
+            include_diff: Whether to compute a unified diff for mismatches;
+                if False only the match result is determined
 
         Returns:
             NamelistDiff with comparison results
         """
-        # Check if files exist
-        if not generated_path.exists():
+        # Read each file once; a missing file is detected by the read itself
+        try:
+            generated_data = self._read_namelist_bytes(generated_path)
+        except FileNotFoundError:
             logger.warning(f"Generated namelist not found: {generated_path}")
             return NamelistDiff(
                 namelist_name=namelist_name,
@@ -397,7 +642,9 @@ class NamelistComparator:
                 is_match=False,
             )
 
-        if not reference_path.exists():
+        try:
+            reference_data = self._read_namelist_bytes(reference_path)
+        except FileNotFoundError:
             logger.debug(f"Reference namelist not found: {reference_path}")
             # Treat missing reference as a mismatch so users become aware that
             # the expected NOAA reference file is not present for the pinned tag.
@@ -409,9 +656,19 @@ class NamelistComparator:
                 is_match=False,
             )
 
-        # Read and normalize files
-        generated_lines = self._read_namelist_lines(generated_path)
-        reference_lines = self._read_namelist_lines(reference_path)
+        # Byte-identical files match without normalizing either of them
+        if generated_data is not None and generated_data == reference_data:
+            return NamelistDiff(
+                namelist_name=namelist_name,
+                generated_path=generated_path,
+                reference_path=reference_path,
+                diff_content="",
+                is_match=True,
+            )
+
+        # Normalize files
+        generated_lines = self._decode_namelist_lines(generated_data, generated_path)
+        reference_lines = self._decode_namelist_lines(reference_data, reference_path)
 
         # Compare
         if generated_lines == reference_lines:
@@ -423,6 +680,15 @@ class NamelistComparator:
                 is_match=True,
             )
 
+        if not include_diff:
+            return NamelistDiff(
+                namelist_name=namelist_name,
+                generated_path=generated_path,
+                reference_path=reference_path,
+                diff_content="Namelist differs from reference (diff not computed)",
+                is_match=False,
+            )
+
         # Generate unified diff
         diff = unified_diff(
             reference_lines,
@@ -432,7 +698,12 @@ class NamelistComparator:
             lineterm="",
         )
 
-        diff_content = "\n".join(diff)
+        diff_lines = list(islice(diff, MAX_DIFF_LINES + 1))
+        if len(diff_lines) > MAX_DIFF_LINES:
+            diff_lines[MAX_DIFF_LINES:] = [
+                f"... (diff truncated after {MAX_DIFF_LINES} lines)"
+            ]
+        diff_content = "\n".join(diff_lines)
 
         return NamelistDiff(
             namelist_name=namelist_name,
@@ -451,18 +722,27 @@ class NamelistComparator:
         Returns:
             List of paths to namelist files
         """
+        # List the directory once and match every pattern against the names
+        try:
+            with os.scandir(generated_dir) as entries:
+                files = {entry.name: entry.path for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
         namelists = []
 
         for pattern in self.namelist_patterns:
-            if "*" in pattern or "?" in pattern:
+            if "/" in pattern:
+                # Pattern reaching into subdirectories
+                namelists.extend(generated_dir.glob(pattern))
+            elif "*" in pattern or "?" in pattern:
                 # Glob pattern
-                matches = list(generated_dir.glob(pattern))
-                namelists.extend(matches)
-            else:
+                namelists.extend(
+                    Path(files[name]) for name in fnmatch.filter(files, pattern)
+                )
+            elif pattern in files:
                 # Specific file
-                path = generated_dir / pattern
-                if path.exists():
-                    namelists.append(path)
+                namelists.append(Path(files[pattern]))
 
         return sorted(namelists)
 
@@ -471,6 +751,7 @@ class NamelistComparator:
         test_name: str,
         generated_dir: Path,
         download_missing: bool = True,
+        include_diff: bool = True,
     ) -> NamelistComparisonReport:
         """Compare all namelists for a test against NOAA references.
 
@@ -478,6 +759,35 @@ class NamelistComparator:
             test_name: Name of the test (e.g., 'tp1.1')
             generated_dir: Directory containing generated namelists
             download_missing: Whether to download missing references
+            include_diff: Whether to compute unified diffs for mismatches
+
+        Returns:
+            NamelistComparisonReport with all comparison results
+        """
+        if not download_missing:
+            return self._compare_test_namelists(
+                test_name, generated_dir, None, include_diff
+            )
+        with self._download_executor() as executor:
+            return self._compare_test_namelists(
+                test_name, generated_dir, executor, include_diff
+            )
+
+    def _compare_test_namelists(
+        self,
+        test_name: str,
+        generated_dir: Path,
+        executor: Optional[ThreadPoolExecutor],
+        include_diff: bool = True,
+    ) -> NamelistComparisonReport:
+        """Compare all namelists for a test, downloading references in executor.
+
+        Args:
+            test_name: Name of the test
+            generated_dir: Directory containing generated namelists
+            executor: Thread pool to download missing references in, or None
+                to use only cached references
+            include_diff: Whether to compute unified diffs for mismatches
 
         Returns:
             NamelistComparisonReport with all comparison results
@@ -517,31 +827,52 @@ class NamelistComparator:
                 differences=[],
             )
 
-        # Download references if needed
-        if download_missing:
-            self.download_all_references(test_name)
+        # Download references in the background if needed; each comparison
+        # only waits for the downloads matching it, so cached ones start
+        # immediately
+        downloads = {}
+        if executor is not None:
+            downloads = self._submit_reference_downloads(executor, test_name)
 
         # Compare each namelist
         differences = []
         namelists_compared = 0
         namelists_matched = 0
 
-        for generated_path in generated_namelists:
-            namelist_name = generated_path.name
+        try:
+            for generated_path in generated_namelists:
+                namelist_name = generated_path.name
+
+                # Wait for every download whose pattern covers this namelist,
+                # so a glob-matched reference is never read mid-download
+                wait(
+                    download
+                    for pattern, download in downloads.items()
+                    if fnmatch.fnmatch(namelist_name, pattern.rsplit("/", 1)[-1])
+                )
 
-            # Get reference path
-            reference_path = self.get_reference_namelist_path(test_name, namelist_name)
+                # Get reference path
+                reference_path = self.get_reference_namelist_path(
+                    test_name, namelist_name
+                )
 
-            # Compare
-            diff = self.compare_namelists(generated_path, reference_path, namelist_name)
-            differences.append(diff)
-            namelists_compared += 1
+                # Compare
+                diff = self.compare_namelists(
+                    generated_path,
+                    reference_path,
+                    namelist_name,
+                    include_diff=include_diff,
+                )
+                differences.append(diff)
+                namelists_compared += 1
 
-            if diff.is_match:
-                namelists_matched += 1
-                logger.debug(f"✓ {namelist_name} matches reference")
-            else:
-                logger.debug(f"✗ {namelist_name} differs from reference")
+                if diff.is_match:
+                    namelists_matched += 1
+                    logger.debug(f"✓ {namelist_name} matches reference")
+                else:
+                    logger.debug(f"✗ {namelist_name} differs from reference")
+        finally:
+            wait(downloads.values())
 
         logger.info(
             f"Namelist comparison complete: {namelists_matched}/{namelists_compared} matched"
@@ -554,6 +885,48 @@ class NamelistComparator:
             differences=differences,
         )
 
+    def compare_tests(
+        self,
+        tests: List[Tuple[str, Path]],
+        download_missing: bool = True,
+        max_workers: int = 8,
+    ) -> Dict[str, NamelistComparisonReport]:
+        """Compare the namelists of several tests concurrently.
+
+        Reference downloads for all tests run in one thread pool no larger
+        than the session's connection pool, so every download reuses a
+        pooled connection instead of opening one that is then discarded.
+
+        Args:
+            tests: Pairs of (test name, directory containing generated namelists)
+            download_missing: Whether to download missing references
+            max_workers: Maximum number of tests compared at the same time
+
+        Returns:
+            Dictionary mapping test names to their comparison reports, in the
+            order of tests
+        """
+        if not tests:
+            return {}
+
+        def compare(test: Tuple[str, Path]) -> NamelistComparisonReport:
+            return self._compare_test_namelists(test[0], test[1], downloads)
+
+        downloads = (
+            ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS)
+            if download_missing
+            else None
+        )
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(tests))
+            ) as executor:
+                reports = list(executor.map(compare, tests))
+        finally:
+            if downloads is not None:
+                downloads.shutdown(wait=True)
+        return {test_name: report for (test_name, _), report in zip(tests, reports)}
+
     def validate_before_execution(
         self,
         test_name: str,
@@ -575,7 +948,10 @@ class NamelistComparator:
         Raises:
             NamelistMismatchError: If raise_on_mismatch=True and mismatches found
         """
-        report = self.compare_test_namelists(test_name, generated_dir)
+        # Diffs are only reported through the exception, so skip them otherwise
+        report = self.compare_test_namelists(
+            test_name, generated_dir, include_diff=raise_on_mismatch
+        )
 
         if not report.is_valid():
             mismatches = report.get_mismatches()
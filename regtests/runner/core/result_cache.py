@@ -0,0 +1,126 @@
+"""Cache of successful test results keyed by test inputs."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .result import TestResult, TestStatus
+from .test import TestCase
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Stores successful TestResults so unchanged tests need not run again.
+
+    A result is keyed by a hash of everything the run depends on that the
+    runner can see: the test configuration file contents, the path, size and
+    modification time of every input file, the backend and its version info,
+    and the run options. Only successful results are stored, so failing tests
+    are always executed again. Runs that validate against reference outputs
+    or namelists are not cached by TestRunner, and a cached result is not
+    reused once its output directory or generated outputs are gone.
+
+    Changes the key cannot see, such as a rebuilt WW3 binary with the same
+    version, are not detected; the cache is therefore opt-in.
+
+    Example:
+        >>> cache = ResultCache(Path("test_outputs/.cache"))
+        >>> runner = TestRunner(backend=backend, result_cache=cache)
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize result cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per cached result
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def key(
+        self,
+        test: TestCase,
+        version_info: Dict[str, str],
+        options: Dict[str, Any],
+    ) -> str:
+        """Compute the cache key for a test run.
+
+        Args:
+            test: TestCase to be executed
+            version_info: Version information of the execution backend
+            options: Run options that affect the result
+
+        Returns:
+            Hex digest identifying the run
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(test.config_path.read_bytes())
+        for input_file in test.get_required_inputs():
+            stat = input_file.stat()
+            relative = input_file.relative_to(test.test_dir).as_posix()
+            digest.update(f"\0{relative}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        digest.update(json.dumps(version_info, sort_keys=True).encode())
+        digest.update(json.dumps(options, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[TestResult]:
+        """Load a cached result.
+
+        Args:
+            key: Cache key from :meth:`key`
+
+        Returns:
+            Cached TestResult, or None if there is no usable entry
+        """
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            with open(cache_file, "r") as f:
+                data = json.load(f)
+            return TestResult(
+                test_name=data["test_name"],
+                status=TestStatus(data["status"]),
+                execution_time=data["execution_time"],
+                outputs_generated=[Path(p) for p in data["outputs_generated"]],
+                error_message=data["error_message"],
+                logs=data.get("logs", ""),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable cached result {cache_file}: {e}")
+            return None
+
+    def store(self, key: str, result: TestResult):
+        """Store a successful result.
+
+        Results that did not succeed are ignored. The entry is written to a
+        temporary file and renamed, so concurrent runs never see partial files.
+
+        Args:
+            key: Cache key from :meth:`key`
+            result: TestResult of the run
+        """
+        if result.status != TestStatus.SUCCESS:
+            return
+
+        data = {
+            "test_name": result.test_name,
+            "status": result.status.value,
+            "execution_time": result.execution_time,
+            "outputs_generated": [str(p) for p in result.outputs_generated],
+            "error_message": result.error_message,
+            "logs": result.logs,
+        }
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except OSError as e:
+            logger.warning(f"Failed to cache result for {result.test_name}: {e}")
+            Path(tmp_path).unlink(missing_ok=True)
@@ -1,14 +1,16 @@
 """Main test runner orchestration."""
 
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 import logging
 
 from typing import TYPE_CHECKING
 
 from .test import TestCase
 from .result import TestResult, TestSuiteResult, TestStatus
+from .result_cache import ResultCache
 from .validator import Validator
 from .namelist_comparator import NamelistComparator
 from ..backends.base import Backend
@@ -63,6 +65,7 @@ class TestRunner:
         reference_dir: Optional[Path] = None,
         validator: Optional[Validator] = None,
         namelist_comparator: Optional[NamelistComparator] = None,
+        result_cache: Optional[ResultCache] = None,
     ):
         """Initialize test runner with execution backend.
 
@@ -72,6 +75,7 @@ class TestRunner:
             reference_dir: Optional directory containing reference outputs for validation
             validator: Optional Validator instance (created if not provided)
             namelist_comparator: Optional NamelistComparator for validating namelists
+            result_cache: Optional ResultCache to reuse results of unchanged tests
         """
         self.backend = backend
         self.output_dir = output_dir or Path("./test_outputs")
@@ -79,6 +83,7 @@ class TestRunner:
         self.reference_dir = reference_dir
         self.validator = validator or Validator()
         self.namelist_comparator = namelist_comparator
+        self.result_cache = result_cache
 
     def discover_tests(self, path: Path, pattern: str = "ww3_tp*") -> List[TestCase]:
         """Discover test cases in directory matching pattern.
@@ -171,6 +176,7 @@ class TestRunner:
         logger.info(f"Running test: {test.name}")
 
         test_output_dir = self.output_dir / test.name
+        output_dir_existed = test_output_dir.is_dir()
         test_output_dir.mkdir(parents=True, exist_ok=True)
 
         validation = test.validate()
@@ -183,6 +189,28 @@ class TestRunner:
             )
 
         try:
+            # Validation depends on reference files the cache key does not cover,
+            # so validated runs are never cached
+            cache_key = None
+            if self.result_cache is not None and not (validate or validate_namelists):
+                cache_key = self.result_cache.key(
+                    test,
+                    version_info=self.backend.get_version_info(),
+                    options={
+                        "backend": type(self.backend).__name__,
+                        "skip_model_execution": skip_model_execution,
+                    },
+                )
+                # A cached result is only valid while the outputs it lists exist
+                cached = (
+                    self.result_cache.load(cache_key) if output_dir_existed else None
+                )
+                if cached is not None and all(
+                    path.exists() for path in cached.outputs_generated
+                ):
+                    logger.info(f"Reusing cached result for test: {test.name}")
+                    return cached
+
             if skip_model_execution and not validate_namelists:
                 logger.info(f"Skipping model execution for test: {test.name}")
                 result = TestResult(
@@ -239,6 +267,8 @@ class TestRunner:
                     logger.warning(f"No reference directory found for {test.name}")
 
             logger.info(f"Test {test.name} completed: {result.status}")
+            if cache_key is not None:
+                self.result_cache.store(cache_key, result)
             return result
         except Exception as e:
             logger.exception(f"Test {test.name} failed with exception")
@@ -254,18 +284,27 @@ class TestRunner:
         validate: bool = False,
         validate_namelists: bool = False,
         skip_model_execution: bool = False,
+        jobs: int = 1,
+        on_result: Optional[Callable[[TestResult], None]] = None,
     ) -> TestSuiteResult:
         """Execute multiple test cases and aggregate results.
 
-        Runs all tests sequentially and aggregates the results into a
-        TestSuiteResult for reporting. Optionally validates against references
-        and/or namelists.
+        Runs the tests and aggregates the results into a TestSuiteResult for
+        reporting. Optionally validates against references and/or namelists.
+
+        Tests run sequentially by default. With jobs > 1, up to that many tests
+        run concurrently in worker threads; each test spends its time waiting
+        on the backend's model process, so threads are enough to overlap them.
+        Results are returned in the order of the input tests, while on_result
+        is called with each result as soon as its test finishes.
 
         Args:
             tests: List of TestCase objects to execute
             validate: If True and reference_dir is set, validate outputs
             validate_namelists: If True, validate generated namelists against NOAA references
             skip_model_execution: If True, skip WW3 execution (only generate/validate namelists)
+            jobs: Maximum number of tests to run concurrently (default: 1)
+            on_result: Optional callback receiving each TestResult as it completes
 
         Returns:
             TestSuiteResult with aggregated outcomes
@@ -277,15 +316,35 @@ class TestRunner:
         """
         logger.info(f"Running {len(tests)} tests")
 
-        results = []
-        for test in tests:
-            result = self.run_test(
+        def run(test: TestCase) -> TestResult:
+            return self.run_test(
                 test,
                 validate=validate,
                 validate_namelists=validate_namelists,
                 skip_model_execution=skip_model_execution,
             )
-            results.append(result)
+
+        def report(result: TestResult) -> TestResult:
+            if on_result is not None:
+                on_result(result)
+            return result
+
+        if jobs > 1 and len(tests) > 1:
+            if validate_namelists and self.namelist_comparator is None:
+                # Create the shared comparator up front rather than racing
+                # to create it lazily from several workers
+                self.namelist_comparator = NamelistComparator()
+            logger.info(f"Running up to {jobs} tests concurrently")
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = {
+                    executor.submit(run, test): index
+                    for index, test in enumerate(tests)
+                }
+                results = [None] * len(tests)
+                for future in as_completed(futures):
+                    results[futures[future]] = report(future.result())
+        else:
+            results = [report(run(test)) for test in tests]
 
         suite_result = TestSuiteResult.from_results(results)
         logger.info(f"Test suite completed: {suite_result.summary()}")
@@ -1,7 +1,9 @@
 """Test case representation and management."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import logging
 import yaml
 
@@ -9,6 +11,25 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=512)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML file, reusing the result while the file is unchanged.
+
+    The modification time and size are part of the cache key so an edited
+    file is parsed again. Callers share the returned dict and must not
+    modify it.
+    """
+    logger.debug(f"Loading config from {path}")
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 
 @dataclass
 class ValidationResult:
@@ -56,6 +77,8 @@ class TestCase:
             config_path: Path to YAML configuration file
         """
         self.config_path = Path(config_path)
+        # Resolved once here rather than on every execution
+        self.config_path_abs = str(self.config_path.absolute())
         self.test_dir = self.config_path.parent
         self._config = None
 
@@ -89,6 +112,10 @@ class TestCase:
     def load_config(self) -> dict:
         """Load and parse YAML configuration.
 
+        Configs are cached by path, modification time and size, so test cases
+        rediscovered for the same file share one parsed dict; treat it as
+        read-only.
+
         Returns:
             Parsed configuration as dictionary
 
@@ -97,37 +124,59 @@ class TestCase:
             yaml.YAMLError: If config file is invalid YAML
         """
         if self._config is None:
-            logger.debug(f"Loading config from {self.config_path}")
-            with open(self.config_path, "r") as f:
-                self._config = yaml.safe_load(f)
+            stat = os.stat(self.config_path)
+            self._config = _load_yaml_cached(
+                self.config_path_abs, stat.st_mtime_ns, stat.st_size
+            )
         return self._config
 
     def get_required_inputs(self) -> List[Path]:
         """List required input files for this test.
 
         Scans the test directory for input files and returns their paths.
+        Symbolic links to files are listed, including broken ones, but
+        symbolic links to directories are not followed.
 
         Returns:
             List of paths to required input files
         """
+        input_files, broken_links = self._scan_inputs()
+        return sorted(input_files + broken_links)
+
+    def _scan_inputs(self) -> Tuple[List[Path], List[Path]]:
+        """Walk the input directory once.
+
+        Returns:
+            Tuple of (input files, broken symbolic links)
+        """
         input_dir = self.test_dir / "input"
-        if not input_dir.exists():
-            return []
+        if not input_dir.is_dir():
+            return [], []
 
-        # List all files in input directory
+        # Walk with scandir so file types come from the directory listing
+        # instead of one stat() per entry; only symbolic links are stat'ed
         input_files = []
-        for file_path in input_dir.rglob("*"):
-            if file_path.is_file():
-                input_files.append(file_path)
-
-        return input_files
+        broken_links = []
+        pending = [input_dir]
+        while pending:
+            directory = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif entry.is_file():
+                        input_files.append(Path(entry.path))
+                    elif entry.is_symlink() and not entry.is_dir():
+                        broken_links.append(Path(entry.path))
+
+        return input_files, broken_links
 
     def validate(self) -> ValidationResult:
         """Validate test case configuration and requirements.
 
         Checks:
         - Configuration file exists and is valid YAML
-        - Required input files are present
+        - Input directory can be read and has no broken symbolic links
         - Configuration has required fields
 
         Returns:
@@ -149,18 +198,21 @@ class TestCase:
                 message=f"Failed to load config: {e}",
             )
 
-        # Check for required input files
-        required_inputs = self.get_required_inputs()
-        missing_files = []
-        for input_file in required_inputs:
-            if not input_file.exists():
-                missing_files.append(input_file)
+        # Required inputs are listed from disk, so only the listing itself
+        # and broken symbolic links can make them unavailable
+        try:
+            _, missing_files = self._scan_inputs()
+        except OSError as e:
+            return ValidationResult(
+                is_valid=False,
+                message=f"Failed to list input files: {e}",
+            )
 
         if missing_files:
             return ValidationResult(
                 is_valid=False,
                 message=f"Missing {len(missing_files)} required input files",
-                missing_files=missing_files,
+                missing_files=sorted(missing_files),
             )
 
         # All checks passed
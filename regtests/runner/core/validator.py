@@ -4,7 +4,10 @@ from pathlib import Path
 from typing import List, Optional, Dict
 from enum import Enum
 import logging
+import filecmp
 import hashlib
+import mmap
+import os
 
 import xarray as xr
 import numpy as np
@@ -13,6 +16,12 @@ from .result import ValidationReport
 
 logger = logging.getLogger(__name__)
 
+# Read size for hashing when hashlib.file_digest is unavailable
+HASH_CHUNK_SIZE = 1 << 20
+
+# Largest file hashed through a memory map rather than streamed reads
+MMAP_HASH_LIMIT = 1 << 30
+
 
 class ComparisonMode(Enum):
     """Comparison mode for numerical tolerance."""
@@ -244,21 +253,24 @@ class Validator:
             reference_ds.close()
 
     def _compare_binary(self, output_file: Path, reference_file: Path) -> bool:
-        """Compare binary files via checksum.
+        """Compare binary files byte for byte.
+
+        Both files are local, so a direct comparison is enough: it stops at
+        the first size or content difference instead of hashing both files
+        in full. Checksums are only computed to report a mismatch.
 
         Args:
             output_file: Test output binary file
             reference_file: Reference binary file
 
         Returns:
-            True if checksums match
+            True if the file contents match
         """
         try:
-            output_hash = self._compute_sha256(output_file)
-            reference_hash = self._compute_sha256(reference_file)
-
-            match = output_hash == reference_hash
-            if not match:
+            match = filecmp.cmp(output_file, reference_file, shallow=False)
+            if not match and logger.isEnabledFor(logging.DEBUG):
+                output_hash = self._compute_sha256(output_file)
+                reference_hash = self._compute_sha256(reference_file)
                 logger.debug(
                     f"Binary mismatch: {output_file.name} "
                     f"(output: {output_hash[:8]}... != ref: {reference_hash[:8]}...)"
@@ -311,9 +323,17 @@ class Validator:
         Returns:
             Hexadecimal hash string
         """
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
+        with open(file_path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if 0 < size <= MMAP_HASH_LIMIT:
+                # Hash the mapped file as one contiguous buffer, without copies
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return hashlib.sha256(mm).hexdigest()
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: read and hash inside the C layer
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            sha256_hash = hashlib.sha256()
+            for byte_block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
                 sha256_hash.update(byte_block)
         return sha256_hash.hexdigest()
 
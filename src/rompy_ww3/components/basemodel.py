@@ -42,10 +42,12 @@ class WW3ComponentBaseModel(RompyBaseModel):
         namelist objects contained in this component and rendering them.
 
         The rendering process:
-        1. Gets the model data using model_dump()
-        2. Iterates through each field in the model
-        3. Renders namelist objects while skipping non-namelist fields
-        4. Combines all rendered content with proper formatting
+        1. Iterates through each field in the model
+        2. Renders namelist objects while skipping unset and non-namelist fields
+        3. Combines all rendered content with proper formatting
+
+        Fields are read directly rather than through model_dump(), which would
+        serialize every nested namelist only for the result to be discarded.
 
         Args:
             *args: Variable positional arguments to pass to render methods
@@ -58,14 +60,12 @@ class WW3ComponentBaseModel(RompyBaseModel):
             Empty namelists return None, which is handled appropriately by callers.
         """
         content = []
-        # Get the model data
-        model_data = self.model_dump()
-        for key, value in model_data.items():
-            if value is None:
+        for key in self.__class__.model_fields:
+            nml = getattr(self, key)
+            if nml is None:
                 continue
             else:
-                nml = getattr(self, key)
-                if isinstance(value, list):
+                if isinstance(nml, list):
                     # Check if this is a list of homogeneous inputs (needs special handling)
                     if key == "homog_input" and nml:
                         # Import here to avoid circular imports
@@ -3,7 +3,7 @@
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
 from .namelists import Domain, Input, OutputType, OutputDate, HomogCount, HomogInput
 from .config import Config
@@ -34,10 +34,10 @@ class NamelistComposition(BaseModel):
         default=None, description="HOMOG_INPUT_NML configurations"
     )
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @validator("domain")
+    @field_validator("domain")
+    @classmethod
     def validate_domain(cls, v):
         """Validate DOMAIN_NML configuration."""
         if v is not None:
@@ -48,17 +48,19 @@ class NamelistComposition(BaseModel):
                 raise ValueError("DOMAIN_NML requires stop time")
         return v
 
-    @validator("input_nml")
+    @field_validator("input_nml")
+    @classmethod
     def validate_input(cls, v):
         """Validate INPUT_NML configuration."""
         # Add input validation logic here if needed
         return v
 
-    @validator("homog_input")
-    def validate_homog_input(cls, v, values):
+    @field_validator("homog_input")
+    @classmethod
+    def validate_homog_input(cls, v, info: ValidationInfo):
         """Validate HOMOG_INPUT_NML configurations against HOMOG_COUNT_NML."""
-        if v is not None and "homog_count" in values:
-            homog_count = values.get("homog_count")
+        if v is not None and "homog_count" in info.data:
+            homog_count = info.data.get("homog_count")
             if homog_count is not None:
                 # Check that the number of inputs matches the counts
                 input_counts = {}
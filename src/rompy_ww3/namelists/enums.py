@@ -7,7 +7,29 @@ Provide a strict parse_enum helper for robust, case-insensitive lookup.
 from __future__ import annotations
 
 from enum import Enum, IntEnum
-from typing import Type, Union
+from functools import lru_cache
+from typing import Dict, Tuple, Type, Union
+
+
+@lru_cache(maxsize=None)
+def _string_lookup(enum_cls: Type[Enum]) -> Tuple[Dict[str, Enum], Dict[str, Enum]]:
+    """
+    Build the string lookup tables used by parse_enum for an Enum class.
+
+    Returns a map of exact member values, and a map of lower-cased values and
+    names. Earlier entries win, so case-insensitive value matches take
+    precedence over name matches as in a linear scan.
+    """
+    exact: Dict[str, Enum] = {}
+    folded: Dict[str, Enum] = {}
+    for m in enum_cls:
+        exact.setdefault(str(m.value), m)
+    for m in enum_cls:
+        if isinstance(m.value, str):
+            folded.setdefault(m.value.lower(), m)
+    for m in enum_cls:
+        folded.setdefault(m.name.lower(), m)
+    return exact, folded
 
 
 def parse_enum(enum_cls: Type[Enum], value: Union[str, int, Enum]) -> Enum:
@@ -50,18 +72,13 @@ def parse_enum(enum_cls: Type[Enum], value: Union[str, int, Enum]) -> Enum:
     # 4. Strings: exact match and tolerant matches
     if isinstance(value, str):
         s = value.strip()
-        for m in enum_cls:
-            if str(m.value) == s:
-                return m
-        # 4b. Case-insensitive match on value (when value is string)
-        for m in enum_cls:
-            if isinstance(m.value, str) and m.value.lower() == s.lower():
-                return m
-        # 5. Case-insensitive name match
-        low = s.lower()
-        for m in enum_cls:
-            if m.name.lower() == low:
-                return m
+        exact, folded = _string_lookup(enum_cls)
+        member = exact.get(s)
+        if member is None:
+            # 4b/5. Case-insensitive match on value, then on name
+            member = folded.get(s.lower())
+        if member is not None:
+            return member
 
     # 7. Unknown
     allowed = ", ".join(str(getattr(m, "value", m)) for m in enum_cls)
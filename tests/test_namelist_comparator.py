@@ -9,12 +9,15 @@ This script tests the NamelistComparator class by:
 """
 
 import sys
+import threading
+import time
 from pathlib import Path
 
 # Add regtests to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "regtests"))
 
 from regtests.runner import NamelistComparator
+from regtests.runner.core.namelist_comparator import MAX_DOWNLOAD_WORKERS
 
 
 def test_identical_namelists():
@@ -149,6 +152,80 @@ def test_missing_reference():
         return False
 
 
+def test_compare_tests_bounds_concurrent_downloads(tmp_path, monkeypatch):
+    """Downloads for a batch of tests never exceed the connection pool size."""
+    comparator = NamelistComparator(reference_dir=tmp_path / "refs")
+    content = "&DOMAIN_NML\n  DOMAIN%IOSTYP = 1\n/\n"
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def fake_fetch(url, local_path, etag=None):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.01)
+        local_path.write_text(content)
+        with lock:
+            active -= 1
+        return len(content), None
+
+    monkeypatch.setattr(comparator, "_fetch", fake_fetch)
+
+    tests = []
+    for i in range(8):
+        generated_dir = tmp_path / f"tp9.{i}"
+        generated_dir.mkdir()
+        (generated_dir / "ww3_shel.nml").write_text(content)
+        (generated_dir / "ww3_grid.nml").write_text(content)
+        tests.append((f"tp9.{i}", generated_dir))
+
+    reports = comparator.compare_tests(tests)
+
+    assert list(reports) == [name for name, _ in tests]
+    assert all(report.namelists_matched == 2 for report in reports.values())
+    assert all(report.is_valid() for report in reports.values())
+    assert 1 < max_active <= MAX_DOWNLOAD_WORKERS
+
+
+def test_compare_waits_for_glob_pattern_downloads(tmp_path, monkeypatch):
+    """A namelist is compared only after every download matching it finished."""
+    comparator = NamelistComparator(
+        reference_dir=tmp_path / "refs",
+        namelist_patterns=["ww3_shel.nml", "ww3_*.nml"],
+    )
+    content = "&DOMAIN_NML\n/\n"
+    pending = set()
+
+    def fake_fetch(url, local_path, etag=None):
+        pending.add(url)
+        if "*" in url:
+            time.sleep(0.05)
+        local_path.write_text(content)
+        pending.discard(url)
+        return len(content), None
+
+    compare_namelists = comparator.compare_namelists
+    seen_pending = []
+
+    def recording_compare(*args, **kwargs):
+        seen_pending.append(set(pending))
+        return compare_namelists(*args, **kwargs)
+
+    monkeypatch.setattr(comparator, "_fetch", fake_fetch)
+    monkeypatch.setattr(comparator, "compare_namelists", recording_compare)
+
+    generated_dir = tmp_path / "tp9.0"
+    generated_dir.mkdir()
+    (generated_dir / "ww3_shel.nml").write_text(content)
+
+    report = comparator.compare_test_namelists("tp9.0", generated_dir)
+
+    assert report.is_valid()
+    assert seen_pending and all(not urls for urls in seen_pending)
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 70)
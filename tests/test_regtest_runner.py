@@ -0,0 +1,293 @@
+"""Tests for the regression test runner orchestration."""
+
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+# Add regtests to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "regtests"))
+
+# Imported as a module so pytest does not try to collect the Test* classes
+from regtests import runner as regtest_runner
+from regtests.runner.backends import DockerBackend, LocalBackend
+
+
+class RecordingBackend(regtest_runner.Backend):
+    """Backend that records how many tests execute at the same time."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def execute(self, test, workdir):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return regtest_runner.TestResult(
+            test_name=test.name, status=regtest_runner.TestStatus.SUCCESS
+        )
+
+    def validate_env(self):
+        return True
+
+    def get_version_info(self):
+        return {}
+
+
+def _make_tests(root, count):
+    tests = []
+    for i in range(count):
+        test_dir = root / f"ww3_tp9.{i}"
+        test_dir.mkdir()
+        config = test_dir / f"rompy_ww3_tp9_{i}.yaml"
+        config.write_text("run_id: test\n")
+        tests.append(regtest_runner.TestCase(config_path=config))
+    return tests
+
+
+def test_run_all_sequential_by_default(tmp_path):
+    backend = RecordingBackend()
+    runner = regtest_runner.TestRunner(backend=backend, output_dir=tmp_path / "out")
+    tests = _make_tests(tmp_path, 3)
+
+    suite = runner.run_all(tests)
+
+    assert backend.max_active == 1
+    assert [r.test_name for r in suite.results] == [t.name for t in tests]
+    assert suite.passed == 3
+
+
+def test_run_all_with_jobs_runs_concurrently_in_order(tmp_path):
+    backend = RecordingBackend()
+    runner = regtest_runner.TestRunner(backend=backend, output_dir=tmp_path / "out")
+    tests = _make_tests(tmp_path, 4)
+
+    suite = runner.run_all(tests, jobs=4)
+
+    assert backend.max_active > 1
+    assert [r.test_name for r in suite.results] == [t.name for t in tests]
+    assert suite.passed == 4
+
+
+def test_get_required_inputs_lists_nested_files(tmp_path):
+    (test,) = _make_tests(tmp_path, 1)
+    input_dir = test.test_dir / "input"
+    (input_dir / "forcing").mkdir(parents=True)
+    (input_dir / "grid.inp").write_text("")
+    (input_dir / "forcing" / "wind.nc").write_text("")
+
+    assert test.get_required_inputs() == [
+        input_dir / "forcing" / "wind.nc",
+        input_dir / "grid.inp",
+    ]
+    assert test.validate().is_valid
+
+
+def test_get_required_inputs_does_not_follow_directory_symlinks(tmp_path):
+    (test,) = _make_tests(tmp_path, 1)
+    input_dir = test.test_dir / "input"
+    (input_dir / "forcing").mkdir(parents=True)
+    (input_dir / "forcing" / "wind.nc").write_text("")
+    (input_dir / "forcing" / "loop").symlink_to(input_dir)
+    (input_dir / "shared").symlink_to(input_dir / "forcing")
+    (input_dir / "wind_link.nc").symlink_to(input_dir / "forcing" / "wind.nc")
+
+    assert test.get_required_inputs() == [
+        input_dir / "forcing" / "wind.nc",
+        input_dir / "wind_link.nc",
+    ]
+    assert test.validate().is_valid
+
+
+def test_validate_reports_broken_input_links(tmp_path):
+    (test,) = _make_tests(tmp_path, 1)
+    input_dir = test.test_dir / "input"
+    input_dir.mkdir()
+    (input_dir / "grid.inp").write_text("")
+    (input_dir / "wind.nc").symlink_to(tmp_path / "missing.nc")
+
+    assert test.get_required_inputs() == [
+        input_dir / "grid.inp",
+        input_dir / "wind.nc",
+    ]
+    validation = test.validate()
+    assert not validation.is_valid
+    assert validation.missing_files == [input_dir / "wind.nc"]
+
+
+def test_run_all_reports_results_as_they_complete(tmp_path):
+    backend = RecordingBackend()
+    runner = regtest_runner.TestRunner(backend=backend, output_dir=tmp_path / "out")
+    tests = _make_tests(tmp_path, 3)
+    reported = []
+
+    suite = runner.run_all(tests, jobs=3, on_result=reported.append)
+
+    assert sorted(r.test_name for r in reported) == sorted(t.name for t in tests)
+    assert [r.test_name for r in suite.results] == [t.name for t in tests]
+
+
+class CountingBackend(RecordingBackend):
+    """Backend that counts executions."""
+
+    def __init__(self):
+        super().__init__(delay=0)
+        self.executed = 0
+
+    def execute(self, test, workdir):
+        self.executed += 1
+        return super().execute(test, workdir)
+
+
+def test_result_cache_reuses_successful_results(tmp_path):
+    backend = CountingBackend()
+    cache = regtest_runner.ResultCache(tmp_path / "out" / ".cache")
+    runner = regtest_runner.TestRunner(
+        backend=backend, output_dir=tmp_path / "out", result_cache=cache
+    )
+    (test,) = _make_tests(tmp_path, 1)
+
+    first = runner.run_test(test)
+    second = runner.run_test(test)
+    assert backend.executed == 1
+    assert second.test_name == first.test_name
+    assert second.status == regtest_runner.TestStatus.SUCCESS
+
+    test.config_path.write_text("run_id: changed\n")
+    runner.run_test(test)
+    assert backend.executed == 2
+
+
+def test_result_cache_skips_validated_runs_and_removed_outputs(tmp_path):
+    backend = CountingBackend()
+    cache = regtest_runner.ResultCache(tmp_path / "out" / ".cache")
+    runner = regtest_runner.TestRunner(
+        backend=backend, output_dir=tmp_path / "out", result_cache=cache
+    )
+    (test,) = _make_tests(tmp_path, 1)
+
+    runner.run_test(test, validate=True)
+    runner.run_test(test, validate=True)
+    assert backend.executed == 2
+    assert not list(cache.cache_dir.glob("*.json"))
+
+    runner.run_test(test)
+    runner.run_test(test)
+    assert backend.executed == 3
+
+    (tmp_path / "out" / test.name).rmdir()
+    runner.run_test(test)
+    assert backend.executed == 4
+
+
+def test_result_cache_key_failure_returns_error_result(tmp_path, monkeypatch):
+    backend = CountingBackend()
+    cache = regtest_runner.ResultCache(tmp_path / "out" / ".cache")
+    runner = regtest_runner.TestRunner(
+        backend=backend, output_dir=tmp_path / "out", result_cache=cache
+    )
+    (test,) = _make_tests(tmp_path, 1)
+
+    def vanished(*args, **kwargs):
+        raise FileNotFoundError("input removed")
+
+    monkeypatch.setattr(cache, "key", vanished)
+    result = runner.run_test(test)
+
+    assert result.status == regtest_runner.TestStatus.ERROR
+    assert "input removed" in result.error_message
+    assert backend.executed == 0
+
+
+def test_result_cache_round_trips_logs(tmp_path):
+    cache = regtest_runner.ResultCache(tmp_path)
+    result = regtest_runner.TestResult(
+        test_name="tp9.0",
+        status=regtest_runner.TestStatus.SUCCESS,
+        execution_time=1.5,
+        logs="model output",
+    )
+
+    cache.store("key", result)
+
+    assert cache.load("key") == result
+
+
+def test_load_config_reparses_edited_file(tmp_path):
+    (test,) = _make_tests(tmp_path, 1)
+    assert test.load_config() == {"run_id": "test"}
+    assert regtest_runner.TestCase(test.config_path).load_config() is (
+        test.load_config()
+    )
+
+    test.config_path.write_text("run_id: edited\n")
+    assert regtest_runner.TestCase(test.config_path).load_config() == {
+        "run_id": "edited"
+    }
+
+
+def test_local_backend_probes_rompy_once_across_threads(monkeypatch):
+    calls = []
+
+    def slow_probe():
+        calls.append(1)
+        time.sleep(0.05)
+        return "0.0.0"
+
+    backend = LocalBackend()
+    monkeypatch.setattr(backend, "_run_rompy_version", slow_probe)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(backend.validate_env()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True] * 4
+    assert len(calls) == 1
+    assert backend.get_version_info() == {"rompy": "0.0.0"}
+
+
+def test_docker_backend_probes_daemon_once_across_threads(monkeypatch):
+    calls = []
+
+    class SlowClient:
+        def ping(self):
+            calls.append("ping")
+            time.sleep(0.05)
+
+        def version(self):
+            calls.append("version")
+            time.sleep(0.05)
+            return {"Version": "24.0"}
+
+    fake_docker = types.SimpleNamespace(from_env=SlowClient)
+    monkeypatch.setitem(sys.modules, "docker", fake_docker)
+
+    backend = DockerBackend(image="rompy/ww3:test")
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                (backend.validate_env(), backend.get_version_info())
+            )
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [(True, {"docker": "24.0", "image": "rompy/ww3:test"})] * 4
+    assert sorted(calls) == ["ping", "version"]